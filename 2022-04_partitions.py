@@ -1,51 +1,18 @@
-from collections import defaultdict
 from manim import *
 
-BH_DARKGREEN = '#455D3E'
-
-custom_tex_template = TexTemplate()
-custom_tex_template.add_to_preamble(r"\usepackage[charter]{mathdesign}")
-MathTex.set_default(tex_template=custom_tex_template)
-
-config.background_color = BH_DARKGREEN
-
-
-def partitions(n, I=1):  # from https://stackoverflow.com/a/44209393/18189631
-    yield (n,)
-    for i in range(I, n//2 + 1):
-        for p in partitions(n-i, i):
-            yield (i,) + p
-
-def unique_to_odd(partition):
-    r"""Given a partition with unique parts, returns the
-    corresponding (w.r.t. Glaisher's bijection) partition
-    with only odd parts.
-    """
-    assert len(partition) == len(set(partition))
-    odd_parts_map = defaultdict(int)
-    for part in partition:
-        j = 0
-        while part % 2 == 0:
-            part //= 2
-            j += 1
-        odd_parts_map[part] += 2**j
-    return tuple(sum([[p]*v for p, v in sorted(odd_parts_map.items(), reverse=True)], []))     
-
-
-class YoungTableau(VMobject):
-    def __init__(self, *parts, square_length=1, **kwargs):
-        super().__init__(**kwargs)
-        self.integer_parts = parts
-        part_groups = [
-            VGroup(*[Square(side_length=square_length) for x in range(part)]).arrange(RIGHT, buff=0)
-            for part in parts
-        ]
-        VGroup(*part_groups).arrange(DOWN, buff=0)
-        for part_group in part_groups[1:]:
-            part_group.set_x(part_groups[0].get_x(LEFT), LEFT)
-        for part_group in part_groups:
-            for part in part_group:
-                self.add(part)
+from manim_content.animations import CreateArcs, RestyleMembers
+from manim_content.assets import image_mobject
+from manim_content.camera import CullingScene, LODScene
+from manim_content.combinatorics import distinct_partitions, partitions, unique_to_odd
+from manim_content.copy_on_write import CopyOnWriteScene
+from manim_content.mobjects import (
+    ArcBundle, YoungDiagramOutline, YoungTableau, align_outlines, arrange_tableaux,
+    enumeration_tableaux,
+)
+from manim_content.sampling import boltzmann_partition
+from manim_content.style import BH_DARKGREEN, apply_house_style
+
+apply_house_style()
 
 
 class Intro(Scene):
@@ -102,7 +69,7 @@ class ButWait2(Scene):
         ).arrange(DOWN, buff=1)
         self.add(tex_group)
 
-class PartitionIntro(Scene):
+class PartitionIntro(CopyOnWriteScene):
     def construct(self):
         part1 = MathTex("5 + 5 + 1 + 1 + 1", "=", "13", font_size=75)
         part2 = MathTex("10 + 2 + 1", "=", "13", font_size=75)
@@ -180,19 +147,13 @@ class PartitionIntro(Scene):
         self.wait()
         
 
-class YTEnumeration(Scene):
+class YTEnumeration(CopyOnWriteScene):
     def construct(self):
         self.next_section("Enumeration", skip_animations=False)
-        pts = sorted(partitions(13), reverse=True, key=lambda pt: pt[::-1])
-        yts = [
-            YoungTableau(*partition[::-1], square_length=1)\
-                .set_submobject_colors_by_gradient(RED, YELLOW)\
-                .set_style(stroke_color=BH_DARKGREEN, fill_opacity=1)
-            for partition in pts]
+        yts, yts_bg = enumeration_tableaux(13)
         current = yts[0]
 
-        yts_bg = VGroup(*[yt.copy().set_style(stroke_width=2, fill_color=WHITE, fill_opacity=0.1) for yt in yts])
-        yts_bg.arrange_in_grid(8, 13, buff=2).scale_to_fit_width(config.frame_width - 1)
+        arrange_tableaux(yts_bg, 8, 13, buff=2, width=config.frame_width - 1)
         yts_bg[0].set_style(fill_opacity=0.4)
         for yt in yts:
             if yt.height > config.frame_height:
@@ -213,19 +174,21 @@ class YTEnumeration(Scene):
         self.next_section("The Curious Part", skip_animations=False)
         self.wait()
         self.play(
-            *[ytbg.animate.set_style(fill_color=RED, fill_opacity=1) for ytbg in yts_bg
-            if len(ytbg.integer_parts) == len(set(ytbg.integer_parts))
-            ],
+            RestyleMembers(yts_bg, {
+                ind: RED for ind, ytbg in enumerate(yts_bg)
+                if len(ytbg.integer_parts) == len(set(ytbg.integer_parts))
+            }, fill_opacities=1),
         )
         self.wait()
         self.play(
-            *[ytbg.animate.set_style(fill_color=WHITE, fill_opacity=0.4) for ytbg in yts_bg],
+            RestyleMembers(yts_bg, WHITE, fill_opacities=0.4),
         )
         self.wait()
         self.play(
-            *[ytbg.animate.set_style(fill_color=RED, fill_opacity=1) for ytbg in yts_bg
-            if all(part % 2 == 1 for part in ytbg.integer_parts)
-            ],
+            RestyleMembers(yts_bg, {
+                ind: RED for ind, ytbg in enumerate(yts_bg)
+                if all(part % 2 == 1 for part in ytbg.integer_parts)
+            }, fill_opacities=1),
         )
         self.wait()
 
@@ -248,9 +211,9 @@ class Coincidence2(Scene):
         ).arrange(DOWN, buff=1.5)
         self.add(tex_group)
 
-class EulerGlaisher(Scene):
+class EulerGlaisher(CullingScene):
     def construct(self):
-        euler_img = ImageMobject("euler.jpg").scale_to_fit_width(3)
+        euler_img = image_mobject("euler.jpg", width=3)
         euler_img.to_corner(DOWN + RIGHT, buff=0)
         euler_lab = Tex("Leonhard Euler").scale_to_fit_width(2.75).next_to(euler_img, UP, buff=0.1)
         self.play(FadeIn(euler_img, euler_lab))
@@ -267,15 +230,13 @@ class EulerGlaisher(Scene):
         ).arrange(RIGHT, buff=0.5).to_edge(UP, buff=0.75)
     
         unique_partitions = VGroup(
-            *[YoungTableau(*p[::-1]) for p in partitions(13) if len(set(p)) == len(p)]
+            *[YoungTableau(*p[::-1]) for p in distinct_partitions(13)]
         ).set_style(stroke_color="#455D3E", stroke_width=2, fill_color=WHITE, fill_opacity=0.5)
-        unique_partitions.arrange_in_grid(5, 4, buff=1.5)\
-                         .scale_to_fit_width(config.frame_width/3 - 0.5)
+        arrange_tableaux(unique_partitions, 5, 4, buff=1.5, width=config.frame_width/3 - 0.5)
         odd_partitions = VGroup(
             *[YoungTableau(*p[::-1]) for p in partitions(13) if all(pt % 2 == 1 for pt in p)]
         ).set_style(stroke_color="#455D3E", stroke_width=2, fill_color=WHITE, fill_opacity=0.5)
-        odd_partitions.arrange_in_grid(5, 4, buff=1.5)\
-                      .scale_to_fit_height(unique_partitions.height + 1)
+        arrange_tableaux(odd_partitions, 5, 4, buff=1.5, height=unique_partitions.height + 1)
         VGroup(unique_partitions, odd_partitions).arrange(RIGHT, buff=1.5).set_x(-3/2).to_edge(DOWN)
 
         self.play(Write(theorem[0]), FadeIn(unique_partitions), run_time=3)
@@ -300,8 +261,8 @@ class EulerGlaisher(Scene):
         self.remove(cp)
         self.wait()
 
-        glaisher_img = ImageMobject("glaisher.jpg")
-        glaisher_img.scale_to_fit_width(3).to_corner(DOWN + RIGHT, buff=0)
+        glaisher_img = image_mobject("glaisher.jpg", width=3)
+        glaisher_img.to_corner(DOWN + RIGHT, buff=0)
         glaisher_lab = Tex("James W. L. Glaisher")
         glaisher_lab.scale_to_fit_width(2.75).next_to(glaisher_img, UP, buff=0.1)
         self.play(
@@ -310,14 +271,13 @@ class EulerGlaisher(Scene):
             FadeOut(gf_proof),
             run_time=2
         )
-        self.play(
-            unique_partitions.animate.arrange_in_grid(9, 2, buff=0.25)\
-                                     .scale_to_fit_width(2.5)\
-                                     .to_edge(DOWN),
-            odd_partitions.animate.arrange_in_grid(6, 3, buff=0.15)\
-                                  .scale_to_fit_width(3.25)\
-                                  .to_edge(DOWN),
-        )
+        for tableaux, rows, cols, buff, width in [
+            (unique_partitions, 9, 2, 0.25, 2.5),
+            (odd_partitions, 6, 3, 0.15, 3.25),
+        ]:
+            tableaux.generate_target()
+            arrange_tableaux(tableaux.target, rows, cols, buff=buff, width=width).to_edge(DOWN)
+        self.play(MoveToTarget(unique_partitions), MoveToTarget(odd_partitions))
         self.wait()
         
         map_target = {}
@@ -326,16 +286,13 @@ class EulerGlaisher(Scene):
             [target_yt] = [yt for yt in odd_partitions if yt.integer_parts == target_partition]
             map_target[k] = odd_partitions.submobjects.index(target_yt)
 
-        bijection = VGroup(*[
-            ArcBetweenPoints(
-                unique_partitions[k].get_center(),
-                odd_partitions[map_target[k]].get_center(),
-                angle=-TAU/6, stroke_opacity=0.5, stroke_width=2,
-                color=ORANGE,
-            )
-            for k in range(18)
-        ])
-        self.play(AnimationGroup(*[Create(line) for line in bijection], lag_ratio=0.75), run_time=4)
+        bijection = ArcBundle(
+            [unique_partitions[k].get_center() for k in range(18)],
+            [odd_partitions[map_target[k]].get_center() for k in range(18)],
+            angle=-TAU/6, stroke_opacity=0.5, stroke_width=2,
+            color=ORANGE,
+        )
+        self.play(CreateArcs(bijection, lag_ratio=0.75), run_time=4)
         self.wait()
         
 
@@ -585,7 +542,7 @@ class PauseNow(Scene):
         self.add(tex_group, part)
 
 
-class ResultVisual(Scene):
+class ResultVisual(LODScene):
     def construct(self):
         midline = Line(config.frame_y_radius*UP, config.frame_y_radius*DOWN, color=WHITE, stroke_width=5)
         label_unique = Tex("different parts", font_size=50).to_edge(UP).set_x(-config.frame_x_radius/2)
@@ -595,12 +552,13 @@ class ResultVisual(Scene):
         
         for ind, n in enumerate([6, 10, 15, 20]):
             n_label = MathTex(f"n = {n}", font_size=75).to_edge(UP).add_background_rectangle(config.background_color, opacity=1)
-            unique_partititons = [pt for pt in partitions(n) if len(pt) == len(set(pt))]
+            unique_partititons = list(distinct_partitions(n))
             YT_map = {
                 YoungTableau(*pt[::-1]): YoungTableau(*unique_to_odd(pt)) for pt in unique_partititons
             }
-            unique_YT = VGroup(*YT_map.keys()).arrange_in_grid(cols=ind+2, buff=(1, 2))
-            odd_YT = VGroup(*YT_map.values()).arrange_in_grid(buff=1)
+            fit = dict(width=config.frame_x_radius - 1, height=config.frame_height - 2.5)
+            unique_YT = arrange_tableaux(VGroup(*YT_map.keys()), cols=ind+2, buff=(1, 2), **fit)
+            odd_YT = arrange_tableaux(VGroup(*YT_map.values()), buff=1, **fit)
             for yt in [unique_YT, odd_YT]:
                 yt.set_style(
                     stroke_color="#455D3E",
@@ -608,41 +566,61 @@ class ResultVisual(Scene):
                     fill_color=WHITE,
                     fill_opacity=1
                 )
-                if yt.width / (config.frame_x_radius - 1) >= yt.height / (config.frame_height - 2.5):
-                    yt.scale_to_fit_width(config.frame_x_radius - 1)
-                else:
-                    yt.scale_to_fit_height(config.frame_height - 2.5)
             unique_YT.next_to(label_unique, DOWN, buff=1)
             odd_YT.next_to(label_odd, DOWN, buff=1)
 
-            bijection = VGroup(*[
-                ArcBetweenPoints(
-                    k.get_center(), v.get_center(),
-                    angle=-TAU/4, stroke_width=2,
-                    color=ORANGE, stroke_opacity=0.5)
-                for k, v in YT_map.items()
-            ])
+            bijection = ArcBundle(
+                [k.get_center() for k in YT_map.keys()],
+                [v.get_center() for v in YT_map.values()],
+                angle=-TAU/4, stroke_width=2,
+                color=ORANGE, stroke_opacity=0.5)
 
             self.play(FadeIn(n_label), Write(unique_YT), Write(odd_YT))
-            self.play(Write(bijection))
+            # Write(VGroup(*arcs)) used to draw the arcs linearly, with the
+            # run time and lag ratio that Write derives from the number of arcs
+            arc_count = len(YT_map)
+            self.play(CreateArcs(
+                bijection,
+                rate_func=linear,
+                lag_ratio=min(4 / max(1, arc_count), 0.2),
+                run_time=1 if arc_count < 15 else 2,
+            ))
             self.wait(0.5)
             self.play(FadeOut(unique_YT, odd_YT, bijection, n_label, shift=UP))
             self.wait()
 
 
+class LimitShape(Scene):
+    def construct(self):
+        n = 100_000
+        samples = [boltzmann_partition(n, seed=seed) for seed in range(5)]
+        # fit the longest first row and first column of all samples into the frame
+        width = max(max(part for part, m in sample.items() if m) for sample in samples)
+        height = max(sum(sample.values()) for sample in samples)
+        scale = min((config.frame_width - 1) / width, (config.frame_height - 1) / height)
+        outlines = [
+            YoungDiagramOutline(
+                sample, square_length=scale, orientation="french",
+                stroke_color=BH_DARKGREEN, stroke_width=2, fill_color=WHITE,
+            ).shift((config.frame_width / 2 - 0.5) * LEFT + (config.frame_height / 2 - 0.5) * DOWN)
+            for sample in samples
+        ]
+        label = MathTex(f"n = {n:,}".replace(",", r"\,"), font_size=75).to_corner(UR)
+        self.play(FadeIn(outlines[0]), Write(label))
+        self.wait()
+        for previous, current in zip(outlines, outlines[1:]):
+            align_outlines(previous, current)
+            self.play(ReplacementTransform(previous, current))
+            self.wait(0.5)
+
+
 
 class Thumbnail(Scene):
     def construct(self):
-        pts = sorted(partitions(13), reverse=True, key=lambda pt: pt[::-1])
-        yts = [
-            YoungTableau(*partition[::-1], square_length=1)\
-                .set_submobject_colors_by_gradient(RED, YELLOW)\
-                .set_style(stroke_color=BH_DARKGREEN, fill_opacity=1)
-            for partition in pts]
+        yts, yts_bg = enumeration_tableaux(13)
         current = yts[0]
 
-        yts_bg = VGroup(*[yt.copy().set_style(stroke_width=2, fill_color=WHITE, fill_opacity=0.1) for yt in yts])
-        yts_bg.arrange_in_grid(8, 13, buff=2).scale_to_fit_width(config.frame_width - 0.5)
+        arrange_tableaux(yts_bg, 8, 13, buff=2, width=config.frame_width - 0.5)
         self.add(yts_bg)
 
         title = MathTex("13 = 13.").scale_to_fit_width(config.frame_width-2)
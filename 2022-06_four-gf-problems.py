@@ -3,20 +3,20 @@ import random
 from collections import defaultdict
 from manim import *
 
-BH_DARKGREEN = '#455D3E'
-BH_ORANGE = '#E68330'
+from manim_content.animations import RestyleMembers
+from manim_content.camera import CullingScene
+from manim_content.copy_on_write import CopyOnWriteScene
+from manim_content.markov import roll_until
+from manim_content.mobject_cache import cached_mobject
+from manim_content.mobjects import ChainDiagram, DotLattice, plot_family
+from manim_content.style import BH_DARKGREEN, BH_ORANGE, apply_house_style
+from manim_content.tex_cache import math_tex
 
-custom_tex_template = TexTemplate(
-    documentclass=r"\documentclass[preview, varwidth=285px]{standalone}"
-)
-custom_tex_template.add_to_preamble(r"\usepackage[charter]{mathdesign}")
-MathTex.set_default(tex_template=custom_tex_template)
-
-config.background_color = BH_DARKGREEN
+apply_house_style(documentclass=r"\documentclass[preview, varwidth=285px]{standalone}")
 
 class ScrollingEquation(VGroup):
     def __init__(self, lhs, *rhs, **kwargs):
-        self.equation = MathTex(
+        self.equation = math_tex(
             lhs + "= {}",
             *[f" & {line} " + r"\\" for line in rhs],
             **kwargs
@@ -34,27 +34,44 @@ class ScrollingEquation(VGroup):
     def previous_rhs(self):
         return self.equation[self.displayed_index - 1]
 
-    
+
     def next_equation(self, offset=0):
-        current_rhs = self.equation[self.displayed_index]  
-        next_rhs = self.equation[self.displayed_index+1]
-        next_rhs.set_opacity(0)
-        y_diff = current_rhs.get_y() - next_rhs.get_y() + offset
-        shift_old_parts = []
-        for i in range(1, self.displayed_index + 1):
-            anim = self.equation[i].animate.shift(UP * y_diff)
-            if abs(i - self.displayed_index) >= 1:
-                anim.set_opacity(0)
-            if i == self.displayed_index:
-                anim.set_opacity(0.3)
-            shift_old_parts.append(anim)
-        anims = AnimationGroup(
-            *shift_old_parts,
-            next_rhs.animate.shift(UP * y_diff).set_opacity(1)
-        )
-        self.equation[self.displayed_index + 2:].shift(UP * y_diff)
-        self.displayed_index += 1
-        return anims
+        return self.jump_to_equation(self.displayed_index + 1, offset=offset)
+
+    def scroll(self, steps, offset=0):
+        r"""Scroll by ``steps`` lines (negative values scroll back)
+        within a single animation."""
+        return self.jump_to_equation(self.displayed_index + steps, offset=offset)
+
+    def jump_to_equation(self, index, offset=0):
+        r"""Returns one animation that moves ``equation[index]`` into
+        the position of the currently displayed right hand side.
+
+        The final shift and opacities are computed directly, so jumping
+        over several lines (forwards or backwards) costs one animation.
+        Lines that are invisible before and after the jump are moved
+        without being animated.
+        """
+        if not 1 <= index < len(self.equation):
+            raise IndexError(f"there is no right hand side with index {index}")
+        current_rhs = self.equation[self.displayed_index]
+        target_rhs = self.equation[index]
+        y_diff = current_rhs.get_y() - target_rhs.get_y() + offset
+        visible = {self.displayed_index - 1, self.displayed_index}
+        anims = []
+        for i in range(1, len(self.equation)):
+            if i == index:
+                opacity = 1
+            elif i == index - 1:
+                opacity = 0.3
+            else:
+                opacity = 0
+            if i in visible or opacity > 0:
+                anims.append(self.equation[i].animate.shift(UP * y_diff).set_opacity(opacity))
+            else:
+                self.equation[i].shift(UP * y_diff)
+        self.displayed_index = index
+        return AnimationGroup(*anims)
 
     def get_critical_point(self, direction):
         return VGroup(self.equation[:self.displayed_index + 1]).get_critical_point(direction)
@@ -87,23 +104,14 @@ class Problem1(Scene):
 
 
 
-class ThrowDiagram(Scene):
+class ThrowDiagram(CopyOnWriteScene):
     def construct(self):
         N = 7
-        dots = VGroup(*[Dot() for i in range(N)]).arrange(RIGHT, buff=2)
-        arrows_right = VGroup(*[Arrow(dots[i], dots[i+1], buff=0.2) for i in range(N-1)])
-        five_sixths = VGroup(*[MathTex(r"\frac{5}{6}", font_size=36).next_to(arrows_right[i], UP) for i in range(N-1)])
-        dots[-1].set_opacity(0)
-        arrows_right[-1].set_opacity(0.5)
-        five_sixths[-1].set_opacity(0.5)
-        etc = MathTex(r"\cdots").move_to(dots[-1]).shift(RIGHT*0.25).set_opacity(0.25)
-        outcomes = VGroup(*[MathTex(str(i)).move_to(dots[i]).shift(2*DOWN + 0.75*RIGHT) for i in range(N-1)]).set_color_by_gradient(WHITE, BH_ORANGE)
-        arrows_down = VGroup(*[Arrow(dots[i], outcomes[i], buff=0.2) for i in range(N-1)])
-        one_sixths = VGroup(*[MathTex(r"\frac{1}{6}", font_size=36).next_to(arrows_down[i], RIGHT) for i in range(N-1)]) 
-
-        diagram = VGroup(dots, arrows_right, arrows_down, five_sixths, one_sixths, outcomes, etc)
-        diagram.center()
-        
+        diagram = ChainDiagram.from_chain(roll_until(), N, outcome_gradient=(WHITE, BH_ORANGE))
+        dots, arrows_right, arrows_down = diagram.dots, diagram.arrows_right, diagram.arrows_down
+        five_sixths, one_sixths = diagram.continue_labels, diagram.stop_labels
+        outcomes, etc = diagram.outcomes, diagram.etc
+
         self.wait()
         self.play(FadeIn(dots[0]))
         self.wait()
@@ -224,9 +232,9 @@ class GeometricSeries(Scene):
         ax = Axes(x_range=(1, 40), y_range=(0, 1), x_length=9, y_length=3, tips=False)
         y_lab = MathTex("x^{n+1}").next_to(ax.y_axis, UP)
         x_lab = MathTex("n").next_to(ax.x_axis, RIGHT)
-        plots = VGroup(*[
-            ax.plot(lambda n: x**n) for x in [0.95, 0.9, 0.75, 0.5, 0.3, 0.1, 0.01]
-        ]).set_color_by_gradient(BH_ORANGE, YELLOW)
+        plots = plot_family(
+            ax, lambda x, n: x**n, [0.95, 0.9, 0.75, 0.5, 0.3, 0.1, 0.01]
+        ).set_color_by_gradient(BH_ORANGE, YELLOW)
         self.play(Create(ax))
         self.play(Write(x_lab), Write(y_lab))
         self.play(Write(plots))
@@ -250,7 +258,7 @@ class GeometricSeries(Scene):
 
 
 
-class GeometricDerivative(Scene):
+class GeometricDerivative(CopyOnWriteScene, CullingScene):
     def construct(self):
         geo_sum = MathTex(
             r"\frac{1}{1-x}", "=", r"\sum_{n\geq 0} x^n",
@@ -525,38 +533,32 @@ class Problem2(Scene):
             for ind in range(42)
         }
         self.play(
-            AnimationGroup(*[
-                circle.animate.set_style(fill_color=color_dict[ind])
-                for ind, circle in enumerate(left_circles)
-            ], lag_ratio=0.5, run_time=10)
+            RestyleMembers(left_circles, color_dict, lag_ratio=0.5, run_time=10)
         )
         self.wait()
 
-        self.play(*[
-            circle.animate.set_style(fill_color=[RED, GREEN])
-            for ind, circle in enumerate(right_circles)
-            if color_dict[ind] in [RED, GREEN]
-        ])
+        self.play(RestyleMembers(right_circles, {
+            ind: [RED, GREEN] for ind, color in color_dict.items()
+            if color in [RED, GREEN]
+        }))
         self.wait(0.5)
-        self.play(*[
-            circle.animate.set_style(fill_color=BLUE)
-            for ind, circle in enumerate(right_circles)
-            if color_dict[ind] == BLUE
-        ])
+        self.play(RestyleMembers(right_circles, {
+            ind: BLUE for ind, color in color_dict.items()
+            if color == BLUE
+        }))
         self.wait()
         self.play(
-            AnimationGroup(*[
-                circle.animate.set_style(fill_color=color_dict[ind])
-                for ind, circle in enumerate(right_circles)
-                if color_dict[ind] in [RED, GREEN]
-            ], lag_ratio=0.5, run_time=7)
+            RestyleMembers(right_circles, {
+                ind: color for ind, color in color_dict.items()
+                if color in [RED, GREEN]
+            }, lag_ratio=0.5, run_time=7)
         )
         self.wait()
         
 
 
 
-class Problem3(Scene):
+class Problem3(CullingScene):
     def construct(self):
         title = Title("Problem 3: Fibonacci and a Differential Equation").to_edge(UP)
         statement = Tex(
@@ -699,7 +701,7 @@ class Problem3(Scene):
         self.wait()
 
 
-class SolveODE(Scene):
+class SolveODE(CullingScene):
     def construct(self):
         diff_eq = MathTex("F''(x)", "-", "F'(x)", "-", "F(x)", "= 0").to_edge(UP)
         self.add(diff_eq)
@@ -856,7 +858,23 @@ class SolveODE(Scene):
 
 
 
-class Problem4(Scene):
+@cached_mobject
+def summation_grid(N):
+    r"""Axes with the lattice points :math:`0 \leq \ell \leq n < N` (the
+    lattice is the second submobject)."""
+    axes = Axes(x_range=(-0.15, N), y_range=(-0.15, N), x_length=7, y_length=7)
+    dots = DotLattice.from_axes(
+        axes, [(ell, n) for ell in range(N) for n in range(ell, N)],
+        color=ORANGE, radius=min(DEFAULT_DOT_RADIUS, 2/N),
+    )
+    axes.x_axis.add_labels({k:k for k in range(0, N, max(1, N // 6))})
+    axes.y_axis.add_labels({k:k for k in range(0, N, max(1, N // 6))})
+    ell_lab = MathTex(r"\ell").next_to(axes.x_axis[0], RIGHT)
+    n_lab = MathTex(r"n").next_to(axes.y_axis[0], UP)
+    return VGroup(axes, dots, ell_lab, n_lab)
+
+
+class Problem4(CopyOnWriteScene, CullingScene):
     def construct(self):
         title = Title("Problem 4: A Useful Product").to_edge(UP)
         statement = Tex(
@@ -892,13 +910,8 @@ class Problem4(Scene):
             MathTex(r"a_0 + (a_0 + a_1) x + (a_0 + a_1 + a_2) x^2 + (a_0 + a_1 + a_2 + a_3) x^3 + \cdots"),
         ).arrange(DOWN, buff=0.5)
 
-        axes = Axes(x_range=(-0.15, 6), y_range=(-0.15, 6), x_length=7, y_length=7)
-        dots = VDict({(n, ell): Dot(color=ORANGE).move_to(axes.c2p(ell, n)) for ell in range(6) for n in range(ell, 6)})
-        axes.x_axis.add_labels({k:k for k in range(6)})
-        axes.y_axis.add_labels({k:k for k in range(6)})
-        ell_lab = MathTex(r"\ell").next_to(axes.x_axis[0], RIGHT)
-        n_lab = MathTex(r"n").next_to(axes.y_axis[0], UP)
-        grid = VGroup(axes, dots, ell_lab, n_lab).scale(2/3).next_to(product.current_equation, RIGHT, buff=1).shift(1.5*DOWN)
+        grid = summation_grid(6).scale(2/3).next_to(product.current_equation, RIGHT, buff=1).shift(1.5*DOWN)
+        dots = grid[1]
 
         self.play(Write(product))
         self.wait()
@@ -913,15 +926,11 @@ class Problem4(Scene):
 
         self.play(Create(grid))
         self.wait()
-        self.play(AnimationGroup(*[
-            Indicate(VGroup(*[dots[(n, ell)] for n in range(ell, 6)]))
-            for ell in range(0, 6)
-        ], lag_ratio=0.5))
+        columns = dots.split(*[dots.columns[ell] for ell in range(0, 6)])
+        self.play(AnimationGroup(*[Indicate(column) for column in columns], lag_ratio=0.5))
         self.wait(0.5)
-        self.play(AnimationGroup(*[
-            Indicate(VGroup(*[dots[(n, ell)] for ell in range(n+1)]))
-            for n in range(0, 6)
-        ], lag_ratio=0.5))
+        rows = dots.split(*[dots.rows[n] for n in range(0, 6)])
+        self.play(AnimationGroup(*[Indicate(row) for row in rows], lag_ratio=0.5))
 
         self.wait()
 
@@ -954,17 +963,17 @@ class Problem4(Scene):
 
 
 class OrderSummation(Scene):
+    N = 6
+
     def construct(self):
-        axes = Axes(x_range=(-0.15, 6), y_range=(-0.15, 6), x_length=7, y_length=7)
-        dots = VGroup(*[Dot(color=ORANGE).move_to(axes.c2p(ell, n)) for ell in range(6) for n in range(ell, 6)])
-        axes.x_axis.add_labels({k:k for k in range(6)})
-        axes.y_axis.add_labels({k:k for k in range(6)})
-        ell_lab = MathTex(r"\ell").next_to(axes.x_axis[0], RIGHT)
-        n_lab = MathTex(r"n").next_to(axes.y_axis[0], UP)
-        self.add(axes, dots, ell_lab, n_lab)
+        self.add(*summation_grid(self.N))
         VGroup(*self.mobjects).center()
 
 
+class OrderSummationLarge(OrderSummation):
+    N = 100
+
+
 class FourProblemsThumbnail(Scene):
     def construct(self):
         hl = Line(
@@ -0,0 +1,5 @@
+r"""Shared helpers for the scene scripts in this repository.
+
+Modules that only do mathematics (e.g. :mod:`manim_content.markov`) do
+not import manim; everything that builds mobjects does.
+"""
@@ -0,0 +1,190 @@
+r"""Animations shared between the scene scripts."""
+from collections.abc import Mapping, Sequence
+
+import numpy as np
+from manim import Animation, VMobject
+
+
+def member_alphas(alpha, count, lag_ratio, rate_func, lag_profile=None):
+    r"""Progress of ``count`` staggered members at overall progress ``alpha``.
+
+    Without ``lag_profile`` this is :meth:`.Animation.get_sub_alpha` for all
+    members at once; ``lag_profile`` instead gives explicit start times in
+    :math:`[0, 1)`, and every member then runs for the same duration.
+    """
+    if lag_profile is not None:
+        starts = np.asarray(lag_profile, dtype=float)
+        sub_alphas = (alpha - starts) / (1 - starts.max())
+    else:
+        full_length = (count - 1) * lag_ratio + 1
+        sub_alphas = alpha * full_length - np.arange(count) * lag_ratio
+    sub_alphas = np.clip(sub_alphas, 0, 1)
+    try:
+        result = np.asarray(rate_func(sub_alphas), dtype=float)
+        if result.shape == sub_alphas.shape:
+            return result
+    except (TypeError, ValueError):
+        pass
+    return np.array([rate_func(a) for a in sub_alphas], dtype=float)
+
+
+def _per_member(values, count):
+    r"""Normalize a per-member style argument to a dictionary
+    ``{index: value}``; single values (and ``None``) are returned as is."""
+    if values is None:
+        return None
+    if isinstance(values, Mapping):
+        return dict(values)
+    if isinstance(values, Sequence) and not isinstance(values, str) and len(values) == count:
+        return {i: v for i, v in enumerate(values) if v is not None}
+    return values
+
+
+class RestyleMembers(Animation):
+    r"""Animate the fill color and opacity of many submobjects of ``group``
+    as one animation.
+
+    Instead of one ``.animate`` (and thus one deep copy) per member, the
+    start and target fill colors of all affected members are stacked into a
+    single array which is interpolated in one step per frame.
+
+    Parameters
+    ----------
+    group
+        The mobject whose submobjects are restyled.
+    fill_colors
+        A mapping ``{index: color}``, a sequence with one entry per
+        submobject (``None`` keeps a color), or a single color for all
+        selected members. Lists of colors produce gradients.
+    fill_opacities
+        Same formats as ``fill_colors``.
+    lag_profile
+        Optional explicit start times in :math:`[0, 1)` for the selected
+        members; otherwise ``lag_ratio`` staggers them in index order.
+
+    Members are selected by the mappings and sequences that are passed; if
+    both arguments are single values, all submobjects are restyled.
+    """
+    def __init__(self, group, fill_colors=None, fill_opacities=None, lag_profile=None, **kwargs):
+        super().__init__(group, **kwargs)
+        count = len(group.submobjects)
+        colors = _per_member(fill_colors, count)
+        opacities = _per_member(fill_opacities, count)
+        per_member = [values for values in (colors, opacities) if isinstance(values, dict)]
+        if per_member:
+            self.indices = sorted(set().union(*per_member))
+        else:
+            self.indices = list(range(count))
+        self.fill_colors = colors
+        self.fill_opacities = opacities
+        if lag_profile is not None and len(lag_profile) != len(self.indices):
+            raise ValueError("lag_profile needs one start time per restyled member")
+        self.lag_profile = lag_profile
+
+    def _value_for(self, values, index):
+        if isinstance(values, dict):
+            return values.get(index)
+        return values
+
+    def begin(self):
+        # deliberately no starting copy of the group, only its fill arrays
+        self.leaves, owners, starts, targets = [], [], [], []
+        for position, index in enumerate(self.indices):
+            color = self._value_for(self.fill_colors, index)
+            opacity = self._value_for(self.fill_opacities, index)
+            for leaf in self.mobject.submobjects[index].family_members_with_points():
+                if not isinstance(leaf, VMobject):
+                    continue
+                current = np.array(leaf.get_fill_rgbas(), dtype=float)
+                target = leaf.generate_rgbas_array(color, 1 if opacity is None else opacity)
+                rows = max(len(current), len(target))
+                current, target = _stretch(current, rows), _stretch(target, rows)
+                if color is None:
+                    target[:, :3] = current[:, :3]
+                if opacity is None:
+                    target[:, 3] = current[:, 3]
+                self.leaves.append(leaf)
+                owners.append(position)
+                starts.append(current)
+                targets.append(target)
+        rows = max((len(s) for s in starts), default=1)
+        self.leaf_rows = np.array([len(s) for s in starts], dtype=int)
+        self.leaf_owners = np.array(owners, dtype=int)
+        self.start_rgbas = np.array([_pad(s, rows) for s in starts]).reshape(-1, rows, 4)
+        self.target_rgbas = np.array([_pad(t, rows) for t in targets]).reshape(-1, rows, 4)
+        if self.suspend_mobject_updating:
+            self.mobject.suspend_updating()
+        self.interpolate(0)
+
+    def get_all_mobjects(self):
+        return [self.mobject]
+
+    def interpolate_mobject(self, alpha):
+        alphas = member_alphas(
+            alpha, len(self.indices), self.lag_ratio, self.rate_func, self.lag_profile
+        )
+        leaf_alphas = alphas[self.leaf_owners][:, None, None]
+        rgbas = self.start_rgbas + (self.target_rgbas - self.start_rgbas) * leaf_alphas
+        for leaf, rows, leaf_rgbas in zip(self.leaves, self.leaf_rows, rgbas):
+            leaf.fill_rgbas = leaf_rgbas[:rows]
+
+
+def _stretch(rgbas, rows):
+    r"""Repeat the rows of ``rgbas`` like manim's ``stretch_array_to_length``."""
+    if len(rgbas) == rows:
+        return np.array(rgbas, dtype=float)
+    indices = (np.arange(rows) * len(rgbas)) // rows
+    return np.array(rgbas, dtype=float)[indices]
+
+
+def _pad(rgbas, rows):
+    return np.concatenate([rgbas, np.repeat(rgbas[-1:], rows - len(rgbas), axis=0)])
+
+
+def partial_curves(points, alphas):
+    r"""The first ``alphas[i]`` of each path ``points[i]`` made of cubic
+    Bézier curves (shape ``(n, 4 * curves, 3)``), with the same number of
+    curves: the cut curve is split by de Casteljau's algorithm, and all
+    curves after it collapse into the cut point."""
+    count, length, _ = points.shape
+    curves = length // 4
+    p0, p1, p2, p3 = np.moveaxis(points.reshape(count, curves, 4, 3), 2, 0)
+    u = np.clip(alphas[:, None] * curves - np.arange(curves)[None, :], 0, 1)[..., None]
+    p01, p12, p23 = p0 + u * (p1 - p0), p1 + u * (p2 - p1), p2 + u * (p3 - p2)
+    p012, p123 = p01 + u * (p12 - p01), p12 + u * (p23 - p12)
+    p0123 = p012 + u * (p123 - p012)
+    result = np.stack([p0, p01, p012, p0123], axis=2)
+
+    cut = np.minimum(np.floor(alphas * curves).astype(int), curves - 1)
+    cut_points = result[np.arange(count), cut, 3]
+    after = np.arange(curves)[None, :] > cut[:, None]
+    result = np.where(after[..., None, None], cut_points[:, None, None, :], result)
+    return result.reshape(count, length, 3)
+
+
+class CreateArcs(Animation):
+    r"""Draw the arcs of an :class:`~.mobjects.ArcBundle` from their start
+    to their end, staggered like
+    ``AnimationGroup(*[Create(arc) for arc in arcs], lag_ratio=lag_ratio)``
+    (or by an explicit ``lag_profile``), with all arcs cut in one
+    vectorized step per frame."""
+    def __init__(self, bundle, lag_profile=None, **kwargs):
+        super().__init__(bundle, **kwargs)
+        if lag_profile is not None and len(lag_profile) != bundle.arc_count:
+            raise ValueError("lag_profile needs one start time per arc")
+        self.lag_profile = lag_profile
+
+    def begin(self):
+        self.arc_points = self.mobject.get_arc_points()
+        if self.suspend_mobject_updating:
+            self.mobject.suspend_updating()
+        self.interpolate(0)
+
+    def get_all_mobjects(self):
+        return [self.mobject]
+
+    def interpolate_mobject(self, alpha):
+        alphas = member_alphas(
+            alpha, len(self.arc_points), self.lag_ratio, self.rate_func, self.lag_profile
+        )
+        self.mobject.set_arc_points(partial_curves(self.arc_points, alphas))
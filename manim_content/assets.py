@@ -0,0 +1,76 @@
+r"""Images from ``assets/``, decoded once and cached at the resolution they
+are rendered at.
+
+The cache in ``assets/.cache`` holds uncompressed ``.npy`` arrays of the
+downscaled pixels, so repeated renders (and parallel workers) neither
+decode the JPEG again nor hold the full-size image in memory.
+Only :func:`image_mobject` imports manim.
+"""
+import math
+import os
+from pathlib import Path
+
+import numpy as np
+
+ASSETS_DIR = Path(__file__).resolve().parent.parent / "assets"
+CACHE_DIR = ASSETS_DIR / ".cache"
+
+
+def resolve_asset(name, directory=ASSETS_DIR):
+    r"""The file in ``directory`` called ``name``, ignoring case."""
+    directory = Path(directory)
+    exact = directory / name
+    if exact.is_file():
+        return exact
+    matches = [path for path in directory.iterdir() if path.name.lower() == name.lower()]
+    if not matches:
+        raise FileNotFoundError(f"no asset called {name!r} in {directory}")
+    if len(matches) > 1:
+        raise ValueError(f"asset name {name!r} is ambiguous: {sorted(p.name for p in matches)}")
+    return matches[0]
+
+
+def load_image_array(name, pixel_width=None, directory=ASSETS_DIR, cache_dir=CACHE_DIR):
+    r"""RGBA pixels of the asset ``name``, downscaled to at most
+    ``pixel_width`` pixels (the original size for ``None``).
+
+    The result is loaded from a cached array; the cache key contains the
+    size and modification time of the image file.
+    """
+    path = resolve_asset(name, directory)
+    stat = path.stat()
+    cache_file = Path(cache_dir) / (
+        f"{path.stem}-{pixel_width or 'full'}-{stat.st_size}-{stat.st_mtime_ns}.npy"
+    )
+    if not cache_file.exists():
+        from PIL import Image
+
+        with Image.open(path) as image:
+            image = image.convert("RGBA")
+            if pixel_width is not None and image.width > pixel_width:
+                height = max(1, round(image.height * pixel_width / image.width))
+                image = image.resize((pixel_width, height), Image.Resampling.LANCZOS)
+            pixels = np.asarray(image)
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        # write to a private file first, concurrent workers may race here
+        temporary = cache_file.with_name(f"{cache_file.name}.{os.getpid()}.tmp")
+        with open(temporary, "wb") as file:
+            np.save(file, pixels)
+        os.replace(temporary, cache_file)
+    return np.load(cache_file)
+
+
+def rendered_pixel_width(width, config=None):
+    r"""Number of pixels that ``width`` scene units cover at the current quality."""
+    if config is None:
+        from manim import config
+    return max(1, math.ceil(width / config.frame_width * config.pixel_width))
+
+
+def image_mobject(name, width, **kwargs):
+    r"""An :class:`~.ImageMobject` of the asset ``name`` with the given
+    ``width``, decoded at the resolution it is rendered at."""
+    from manim import ImageMobject
+
+    pixels = load_image_array(name, rendered_pixel_width(width))
+    return ImageMobject(pixels, **kwargs).scale_to_fit_width(width)
@@ -0,0 +1,209 @@
+r"""Cameras for scenes with very many (small or hidden) mobjects."""
+import itertools as it
+
+import numpy as np
+from manim import Camera, Scene, VMobject
+from manim.utils.family import extract_mobject_family_members
+
+
+class Sprite:
+    r"""A raster image that replaces a mobject in a single frame; ``x`` and
+    ``y`` are the pixel coordinates of its upper left corner."""
+    def __init__(self, pixels, x, y):
+        self.pixels = pixels
+        self.x = x
+        self.y = y
+
+
+class CullingCamera(Camera):
+    r"""Camera that skips mobjects which cannot be seen: those with zero
+    fill, stroke and background stroke opacity, and those whose bounding
+    box (widened by their stroke) lies outside of the frame.
+
+    The bounding boxes of all mobjects of a frame are computed together by
+    :func:`boxes_in_frame`, with a constant number of numpy calls.
+    """
+    def get_mobjects_to_display(self, mobjects, include_submobjects=True, excluded_mobjects=None):
+        displayed = super().get_mobjects_to_display(
+            mobjects, include_submobjects=include_submobjects, excluded_mobjects=excluded_mobjects
+        )
+        opaque = [
+            mobject for mobject in displayed
+            if not (isinstance(mobject, VMobject) and is_transparent(mobject))
+        ]
+        visible = self.in_frame(opaque)
+        return [mobject for mobject, keep in zip(opaque, visible) if keep]
+
+    def in_frame(self, mobjects):
+        r"""Whether the bounding box of each of the ``mobjects`` meets the
+        frame; mobjects without points count as visible."""
+        margins = np.full(len(mobjects), 0.01)
+        for index, mobject in enumerate(mobjects):
+            if isinstance(mobject, VMobject):
+                # cairo line widths are 0.01 scene units per unit of stroke width
+                margins[index] += 0.01 * max(
+                    mobject.get_stroke_width(), mobject.get_stroke_width(background=True)
+                )
+        return boxes_in_frame(
+            [mobject.points for mobject in mobjects], margins,
+            self.frame_center, self.frame_width, self.frame_height,
+        )
+
+
+def boxes_in_frame(point_arrays, margins, frame_center, frame_width, frame_height):
+    r"""For every array of points, whether its bounding box widened by its
+    margin meets the frame; empty arrays count as inside."""
+    counts = np.array([len(points) for points in point_arrays], dtype=int)
+    result = np.ones(len(point_arrays), dtype=bool)
+    filled = counts > 0
+    if not filled.any():
+        return result
+    points = np.concatenate([
+        points[:, :2] for points, count in zip(point_arrays, counts) if count
+    ])
+    starts = np.concatenate([[0], np.cumsum(counts[filled])[:-1]])
+    margins = np.asarray(margins, dtype=float)[filled, None]
+    lower = np.minimum.reduceat(points, starts) - margins
+    upper = np.maximum.reduceat(points, starts) + margins
+    center = np.asarray(frame_center, dtype=float)[:2]
+    half = np.array([frame_width, frame_height]) / 2
+    result[filled] = np.all(upper >= center - half, axis=1) & np.all(lower <= center + half, axis=1)
+    return result
+
+
+def is_transparent(vmobject):
+    r"""Whether neither the fill nor the (background) stroke of ``vmobject``
+    would draw anything."""
+    if vmobject.fill_rgbas[:, 3].any():
+        return False
+    if vmobject.stroke_width and vmobject.stroke_rgbas[:, 3].any():
+        return False
+    if vmobject.background_stroke_width and vmobject.background_stroke_rgbas[:, 3].any():
+        return False
+    return True
+
+
+class LODCamera(CullingCamera):
+    r"""Camera that draws mobjects which are smaller than ``sprite_threshold``
+    pixels on screen from raster sprites instead of from their paths.
+
+    Mobjects take part by implementing
+
+    - ``get_lod_extent()``, returning the upper left corner, width and
+      height of the mobject in scene units, or ``None`` if it cannot be
+      drawn as a sprite right now, and
+    - ``get_lod_sprite(pixel_width, pixel_height, pixels_per_unit)``,
+      returning an RGBA ``uint8`` array of that size plus an equal margin
+      on all sides (or ``None``).
+
+    Sprites are expected to be cached by the mobjects; all other mobjects,
+    and sprite mobjects that grow above the threshold, are drawn as usual.
+    Hidden mobjects are culled as by :class:`CullingCamera`.
+    """
+    def __init__(self, sprite_threshold=48, **kwargs):
+        self.sprite_threshold = sprite_threshold
+        super().__init__(**kwargs)
+
+    def get_sprite(self, mobject):
+        extent = mobject.get_lod_extent()
+        if extent is None:
+            return None
+        corner, width, height = extent
+        pixels_per_unit = self.pixel_width / self.frame_width
+        if max(width, height) * pixels_per_unit >= self.sprite_threshold:
+            return None
+        pixel_width = max(1, round(width * pixels_per_unit))
+        pixel_height = max(1, round(height * pixels_per_unit))
+        pixels = mobject.get_lod_sprite(pixel_width, pixel_height, pixels_per_unit)
+        if pixels is None:
+            return None
+        (x, y), = self.points_to_subpixel_coords(mobject, np.array([corner]))
+        margin_x = (pixels.shape[1] - pixel_width) // 2
+        margin_y = (pixels.shape[0] - pixel_height) // 2
+        return Sprite(pixels, round(x) - margin_x, round(y) - margin_y)
+
+    def get_mobjects_to_display(self, mobjects, include_submobjects=True, excluded_mobjects=None):
+        mobjects = list(mobjects)
+        displayed = super().get_mobjects_to_display(
+            mobjects, include_submobjects=include_submobjects, excluded_mobjects=excluded_mobjects
+        )
+        if not include_submobjects:
+            return displayed
+        # the first displayed member of a small mobject is replaced by its
+        # sprite, the other members are dropped
+        displayed_ids = {id(mobject) for mobject in displayed}
+        replacements = {}
+        for mobject in extract_mobject_family_members(mobjects):
+            if id(mobject) in replacements or not hasattr(mobject, "get_lod_sprite"):
+                continue
+            members = [m for m in mobject.family_members_with_points() if id(m) in displayed_ids]
+            if not members:
+                continue
+            sprite = self.get_sprite(mobject)
+            if sprite is None:
+                continue
+            replacements[id(members[0])] = sprite
+            for member in members[1:]:
+                replacements[id(member)] = None
+        if not replacements:
+            return displayed
+        result = []
+        for mobject in displayed:
+            replacement = replacements.get(id(mobject), mobject)
+            if replacement is not None:
+                result.append(replacement)
+        return result
+
+    def capture_mobjects(self, mobjects, **kwargs):
+        mobjects = self.get_mobjects_to_display(mobjects, **kwargs)
+        for group_type, group in it.groupby(mobjects, self._display_type):
+            if group_type is Sprite:
+                self.display_multiple_sprites(list(group), self.pixel_array)
+            else:
+                self.display_funcs[group_type](list(group), self.pixel_array)
+
+    def _display_type(self, mobject):
+        if isinstance(mobject, Sprite):
+            return Sprite
+        return self.type_or_raise(mobject)
+
+    def display_multiple_sprites(self, sprites, pixel_array):
+        r"""Alpha-composite the sprites onto ``pixel_array`` (like
+        :meth:`overlay_PIL_image`, but only on the covered pixels).
+
+        Sprites have straight alpha, while cairo keeps the pixels
+        premultiplied by their alpha; the sprites are premultiplied before
+        they are blended.
+        """
+        surface = self.get_cairo_context(pixel_array).get_target()
+        surface.flush()
+        maximum = np.iinfo(pixel_array.dtype).max
+        for sprite in sprites:
+            height, width = sprite.pixels.shape[:2]
+            left, top = max(sprite.x, 0), max(sprite.y, 0)
+            right = min(sprite.x + width, self.pixel_width)
+            bottom = min(sprite.y + height, self.pixel_height)
+            if left >= right or top >= bottom:
+                continue
+            source = sprite.pixels[
+                top - sprite.y:bottom - sprite.y, left - sprite.x:right - sprite.x
+            ].astype(np.float32) / 255
+            target = pixel_array[top:bottom, left:right].astype(np.float32) / maximum
+            alpha = source[..., 3:]
+            source[..., :3] *= alpha
+            pixel_array[top:bottom, left:right] = np.round(
+                (source + target * (1 - alpha)) * maximum
+            )
+        surface.mark_dirty()
+
+
+class CullingScene(Scene):
+    r"""A :class:`~.Scene` rendered with a :class:`CullingCamera`."""
+    def __init__(self, camera_class=CullingCamera, **kwargs):
+        super().__init__(camera_class=camera_class, **kwargs)
+
+
+class LODScene(Scene):
+    r"""A :class:`~.Scene` rendered with an :class:`LODCamera`."""
+    def __init__(self, camera_class=LODCamera, **kwargs):
+        super().__init__(camera_class=camera_class, **kwargs)
@@ -0,0 +1,101 @@
+r"""Integer partitions and Glaisher's bijection, as in ``2022-04_partitions.py``.
+
+The generators yield partitions as tuples of weakly increasing parts;
+:func:`unique_to_odd` returns its parts in decreasing order, ready for
+``YoungTableau``. For large partitions, Glaisher's bijection also works
+on multiplicity forms ``{part: multiplicity}``, without listing every
+part. This module does not import manim.
+"""
+from collections import defaultdict
+
+
+def partitions(n, I=1):  # from https://stackoverflow.com/a/44209393/18189631
+    yield (n,)
+    for i in range(I, n//2 + 1):
+        for p in partitions(n-i, i):
+            yield (i,) + p
+
+
+def has_distinct_parts(partition):
+    return len(partition) == len(set(partition))
+
+
+def has_odd_parts(partition):
+    return all(part % 2 == 1 for part in partition)
+
+
+def distinct_partitions(n, I=1):
+    r"""The partitions of ``n`` into distinct parts, in the same order as
+    ``filter(has_distinct_parts, partitions(n))`` but without generating
+    the other partitions."""
+    yield (n,)
+    for i in range(I, (n - 1)//2 + 1):
+        for p in distinct_partitions(n-i, i+1):
+            yield (i,) + p
+
+
+def odd_partitions(n, I=1):
+    r"""The partitions of ``n`` into odd parts, in the same order as
+    ``filter(has_odd_parts, partitions(n))``."""
+    if n % 2 == 1:
+        yield (n,)
+    for i in range(I + 1 - I % 2, n//2 + 1, 2):
+        for p in odd_partitions(n-i, i):
+            yield (i,) + p
+
+
+def multiplicities(partition):
+    r"""The multiplicity form ``{part: multiplicity}`` of ``partition``, in
+    increasing order of the parts."""
+    counts = defaultdict(int)
+    for part in partition:
+        counts[part] += 1
+    return dict(sorted(counts.items()))
+
+
+def unique_to_odd_multiplicities(partition):
+    r"""Glaisher's bijection on multiplicity forms: a partition with unique
+    parts ``{part: 1}`` (or an iterable of ``(part, 1)`` pairs) is mapped
+    to the partition with only odd parts ``{odd part: multiplicity}``.
+
+    A part :math:`2^j o` with odd :math:`o` contributes :math:`2^j` copies
+    of :math:`o`, so only the multiplicities grow.
+    """
+    odd_parts_map = defaultdict(int)
+    for part, multiplicity in dict(partition).items():
+        assert multiplicity == 1, "parts have to be unique"
+        j = (part & -part).bit_length() - 1
+        odd_parts_map[part >> j] += 1 << j
+    return dict(sorted(odd_parts_map.items()))
+
+
+def odd_to_unique_multiplicities(partition):
+    r"""Inverse of :func:`unique_to_odd_multiplicities`: ``m`` copies of the
+    odd part ``o`` become the parts :math:`2^j o` for the binary digits
+    :math:`2^j` of ``m``."""
+    parts = []
+    for part, multiplicity in dict(partition).items():
+        assert part % 2 == 1, "parts have to be odd"
+        j = 0
+        while multiplicity:
+            if multiplicity & 1:
+                parts.append(part << j)
+            multiplicity >>= 1
+            j += 1
+    return {part: 1 for part in sorted(parts)}
+
+
+def unique_to_odd(partition):
+    r"""Given a partition with unique parts, returns the
+    corresponding (w.r.t. Glaisher's bijection) partition
+    with only odd parts.
+    """
+    assert len(partition) == len(set(partition))
+    odd_parts_map = unique_to_odd_multiplicities(multiplicities(partition))
+    return tuple(sum([[p]*v for p, v in sorted(odd_parts_map.items(), reverse=True)], []))
+
+
+def odd_to_unique(partition):
+    r"""Inverse of :func:`unique_to_odd`, returning the distinct parts in
+    increasing order."""
+    return tuple(odd_to_unique_multiplicities(multiplicities(partition)))
@@ -0,0 +1,105 @@
+r"""Copy-on-write point arrays for copied mobjects.
+
+With copy-on-write enabled, :meth:`~.Mobject.copy` (and thus
+:meth:`~.Mobject.generate_target` and :meth:`~.Mobject.save_state`) lets
+the copy share the point arrays of all :class:`~.VMobject` members with
+the original instead of duplicating them. Shared arrays are marked
+read-only; the methods of manim that modify points in place first give
+the mobject its own array. Style changes and moves (which create new
+arrays anyway) thus never duplicate the Bézier data of a copy.
+
+Should some other code write into a shared array (e.g. :meth:`~.Mobject.wag`
+or ``mobject.points[...] = ...``), numpy raises ``ValueError: assignment
+destination is read-only`` instead of silently changing both mobjects;
+:func:`unshare_points` before such writes. Since this affects all
+mobjects, copy-on-write is opt-in: scenes that copy a lot derive from
+:class:`CopyOnWriteScene`, which enables it only while they are rendered,
+and :func:`~.style.apply_house_style` enables it for all scenes if the
+environment variable ``MANIM_CONTENT_COPY_ON_WRITE`` is set to ``1``.
+"""
+import copy
+import os
+
+from manim import Camera, DecimalNumber, Mobject, Scene, VMobject, Wiggle
+
+_originals = {}
+
+
+def copy_sharing_points(mobject):
+    r"""A deep copy of ``mobject`` whose :class:`~.VMobject` members share
+    their (now read-only) point arrays with those of ``mobject``."""
+    memo = {}
+    for member in mobject.get_family():
+        if isinstance(member, VMobject) and len(member.points):
+            member.points.flags.writeable = False
+            memo[id(member.points)] = member.points
+    return copy.deepcopy(mobject, memo)
+
+
+def unshare_points(mobject):
+    r"""Give all members of ``mobject`` with shared points their own copy."""
+    for member in mobject.get_family():
+        if not member.points.flags.writeable:
+            member.points = member.points.copy()
+    return mobject
+
+
+def _wrap(cls, name, make_wrapper):
+    original = getattr(cls, name)
+    _originals[cls, name] = original
+    setattr(cls, name, make_wrapper(original))
+
+
+def enable_copy_on_write():
+    r"""Enable copy-on-write; returns ``False`` if it already was enabled."""
+    if _originals:
+        return False
+
+    def unsharing_self(original):
+        def method(self, *args, **kwargs):
+            unshare_points(self)
+            return original(self, *args, **kwargs)
+        return method
+
+    def unsharing_submobject(original):
+        def method(self, submobject, *args, **kwargs):
+            unshare_points(submobject)
+            return original(self, submobject, *args, **kwargs)
+        return method
+
+    def writeable_points(original):
+        def method(self, points, *args, **kwargs):
+            if not points.flags.writeable:
+                points = points.copy()
+            return original(self, points, *args, **kwargs)
+        return method
+
+    _wrap(Mobject, "copy", lambda original: copy_sharing_points)
+    # scale, rotate, stretch, flip, apply_function, ... modify points in place
+    _wrap(Mobject, "apply_points_function_about_point", unsharing_self)
+    _wrap(DecimalNumber, "set_value", unsharing_self)
+    _wrap(Wiggle, "interpolate_submobject", unsharing_submobject)
+    _wrap(Camera, "adjust_out_of_range_points", writeable_points)
+    return True
+
+
+def disable_copy_on_write():
+    for (cls, name), original in _originals.items():
+        setattr(cls, name, original)
+    _originals.clear()
+
+
+def enable_copy_on_write_from_environment():
+    if os.environ.get("MANIM_CONTENT_COPY_ON_WRITE", "0") not in ("", "0"):
+        enable_copy_on_write()
+
+
+class CopyOnWriteScene(Scene):
+    r"""A :class:`~.Scene` rendered with copy-on-write copies."""
+    def render(self, *args, **kwargs):
+        enabled = enable_copy_on_write()
+        try:
+            return super().render(*args, **kwargs)
+        finally:
+            if enabled:
+                disable_copy_on_write()
@@ -0,0 +1,112 @@
+r"""Draft mode: :class:`~.MathTex` and :class:`~.Tex` without LaTeX.
+
+In draft mode, TeX that has been compiled before is loaded from manim's
+cache as usual; everything else becomes a placeholder with one box per
+(estimated) glyph. The ``\special`` markers that manim uses to split a
+:class:`~.MathTex` into its parts are kept as SVG groups, so indexing like
+``expectation[6][1:10]`` still works on the placeholders. Enable it with
+:func:`enable_draft_mode` or by setting the environment variable
+``MANIM_CONTENT_DRAFT=1`` before rendering, e.g.::
+
+    MANIM_CONTENT_DRAFT=1 manim -ql 2022-06_four-gf-problems.py Problem1
+"""
+import os
+import re
+from xml.sax.saxutils import quoteattr
+
+from manim import config
+from manim.mobject.text import tex_mobject
+from manim.utils.tex_file_writing import generate_tex_file, tex_hash, tex_to_svg_file
+
+# rough glyph metrics of a 10pt font, in pt
+GLYPH_WIDTH = 5.0
+GLYPH_HEIGHT = 7.0
+GLYPH_GAP = 0.6
+LINE_HEIGHT = 14.0
+
+GROUP_MARKER = re.compile(r"\\special\{dvisvgm:raw (<g id='[^']*'>|</g>)\}")
+NO_GLYPHS = re.compile(r"\\(?:begin|end)\{[^}]*\}|\\fontsize\{[^}]*\}\{[^}]*\}")
+TOKEN = re.compile(r"\\\\|\\[A-Za-z]+|\\.|[^\s{}^_&$]")
+INVISIBLE = {
+    "left", "right", "big", "Big", "bigg", "Bigg", "bigl", "bigr", "Bigl", "Bigr",
+    "biggl", "biggr", "Biggl", "Biggr", "displaystyle", "textstyle", "scriptstyle",
+    "text", "textbf", "textit", "mathrm", "mathbf", "mathit", "mathcal", "mathbb",
+    "operatorname", "begin", "end", "selectfont", "fontsize", "limits", "nolimits",
+    "quad", "qquad", "hspace", "vspace", "phantom", "colon", ",", ";", "!", " ",
+}
+
+
+def estimate_glyphs(tex):
+    r"""Yield ``"glyph"``, ``"space"`` or ``"newline"`` for every token of ``tex``."""
+    for token in TOKEN.findall(NO_GLYPHS.sub(" ", tex)):
+        if token == "\\\\":
+            yield "newline"
+        elif token.startswith("\\") and token[1:] in INVISIBLE:
+            yield "space" if token[1:] in ("quad", "qquad") else None
+        else:
+            yield "glyph"
+
+
+def placeholder_svg(expression):
+    r"""SVG with one box per estimated glyph of ``expression``, keeping
+    manim's part groups."""
+    body = []
+    x = y = 0.0
+    width = 0.0
+    for piece in GROUP_MARKER.split(expression):
+        if piece.startswith("<g id="):
+            group_id = piece[len("<g id='"):-2]
+            body.append(f"<g id={quoteattr(group_id)}>")
+        elif piece == "</g>":
+            body.append("</g>")
+        else:
+            for glyph in estimate_glyphs(piece):
+                if glyph == "newline":
+                    x, y = 0.0, y + LINE_HEIGHT
+                elif glyph == "space":
+                    x += GLYPH_WIDTH
+                elif glyph == "glyph":
+                    body.append(
+                        f"<path d='M {x:.2f} {y:.2f} h {GLYPH_WIDTH} v {GLYPH_HEIGHT} "
+                        f"h {-GLYPH_WIDTH} Z'/>"
+                    )
+                    x += GLYPH_WIDTH + GLYPH_GAP
+                    width = max(width, x)
+    height = y + LINE_HEIGHT
+    return (
+        "<?xml version='1.0' encoding='UTF-8'?>\n"
+        f"<svg xmlns='http://www.w3.org/2000/svg' width='{width:.2f}pt' height='{height:.2f}pt' "
+        f"viewBox='0 0 {width:.2f} {height:.2f}'>\n" + "\n".join(body) + "\n</svg>\n"
+    )
+
+
+def draft_tex_to_svg_file(expression, environment=None, tex_template=None):
+    r"""Replacement for :func:`~.tex_to_svg_file` that uses a cached
+    compile if there is one and a placeholder otherwise."""
+    if tex_template is None:
+        tex_template = config["tex_template"]
+    svg_file = generate_tex_file(expression, environment, tex_template).with_suffix(".svg")
+    if svg_file.exists():
+        return svg_file
+    draft_file = config.get_dir("tex_dir") / "draft" / f"{tex_hash((expression, environment))}.svg"
+    if not draft_file.exists():
+        draft_file.parent.mkdir(parents=True, exist_ok=True)
+        draft_file.write_text(placeholder_svg(expression))
+    return draft_file
+
+
+def enable_draft_mode():
+    tex_mobject.tex_to_svg_file = draft_tex_to_svg_file
+
+
+def disable_draft_mode():
+    tex_mobject.tex_to_svg_file = tex_to_svg_file
+
+
+def draft_mode_enabled():
+    return tex_mobject.tex_to_svg_file is draft_tex_to_svg_file
+
+
+def enable_draft_mode_from_environment():
+    if os.environ.get("MANIM_CONTENT_DRAFT", "") not in ("", "0"):
+        enable_draft_mode()
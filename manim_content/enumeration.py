@@ -0,0 +1,181 @@
+r"""Enumerate partitions of large ``n`` in parallel.
+
+The partitions generated by :mod:`manim_content.combinatorics` are split
+into shards by a common prefix of leading (smallest) parts. Restricted
+partition counts tell how many partitions lie below every prefix, so the
+prefixes are only expanded until each shard holds at most ``shard_size``
+partitions; the shards are then roughly balanced and, concatenated in
+order, give the order of the generator::
+
+    for partition in enumerate_parallel(60, "distinct", jobs=8):
+        ...
+    count_where(has_distinct_parts, 60, jobs=8)
+    check_glaisher(90, jobs=8)
+
+Reductions run inside the workers, one shard at a time, so only one
+number per shard travels back. Functions passed to the workers have to
+be picklable, i.e. defined at module level. This module does not import
+manim.
+"""
+import functools
+import itertools
+import math
+import os
+from multiprocessing import Pool
+
+from manim_content.combinatorics import (
+    distinct_partitions, has_odd_parts, odd_partitions, odd_to_unique, partitions,
+    unique_to_odd,
+)
+
+GENERATORS = {
+    "all": partitions,
+    "distinct": distinct_partitions,
+    "odd": odd_partitions,
+}
+
+
+@functools.lru_cache(maxsize=8)
+def count_table(n, family="all"):
+    r"""Table ``T`` with ``T[m][I]`` the number of partitions the generator of
+    ``family`` yields for ``(m, I)``, i.e. of ``m`` into parts of the family
+    with smallest part at least ``I`` (plus the single part ``m``), for
+    ``0 <= m <= n`` and ``1 <= I <= n + 1``."""
+    table = [[0] * (n + 2) for _ in range(n + 1)]
+    for m in range(n + 1):
+        row = table[m]
+        if family == "odd":
+            single, last, step = m % 2, m//2, 2
+        elif family == "distinct":
+            single, last, step = 1, (m - 1)//2, 1
+        else:
+            single, last, step = 1, m//2, 1
+        offset = 1 if family == "distinct" else 0
+        below = 0  # partitions of m with next part at least I
+        for I in range(n + 1, 0, -1):
+            if I <= last and (step == 1 or I % 2 == 1):
+                below += table[m - I][I + offset]
+            row[I] = single + below
+    return table
+
+
+def count(n, family="all"):
+    r"""The number of partitions of ``n`` in ``family``."""
+    return count_table(n, family)[n][1]
+
+
+def _children(family, m, I):
+    r"""The possible next parts ``i`` after a prefix with remainder ``m`` and
+    the lower bound for the parts after ``i``, as in the generators."""
+    if family == "odd":
+        return [(i, i) for i in range(I + 1 - I % 2, m//2 + 1, 2)]
+    if family == "distinct":
+        return [(i, i + 1) for i in range(I, (m - 1)//2 + 1)]
+    return [(i, i) for i in range(I, m//2 + 1)]
+
+
+def default_shard_size(n, family="all", jobs=None):
+    r"""About 32 shards per worker, but not fewer than 256 partitions each."""
+    jobs = jobs or os.cpu_count() or 1
+    return max(256, math.ceil(count(n, family) / (32 * jobs)))
+
+
+def shards(n, family="all", shard_size=None, jobs=None):
+    r"""Split the partitions of ``n`` in ``family`` into shards ``(prefix, m, I)``.
+
+    A shard stands for ``prefix + p`` for all ``p`` generated with
+    remainder ``m`` and smallest part at least ``I``; ``I is None`` stands
+    for the single partition ``prefix + (m,)``. Prefixes are expanded until
+    a shard holds at most ``shard_size`` partitions.
+    """
+    if shard_size is None:
+        shard_size = default_shard_size(n, family, jobs)
+    table = count_table(n, family)
+
+    def visit(prefix, m, I):
+        if table[m][I] <= shard_size:
+            yield prefix, m, I
+            return
+        if family != "odd" or m % 2 == 1:
+            yield prefix, m, None
+        for i, next_I in _children(family, m, I):
+            yield from visit(prefix + (i,), m - i, next_I)
+
+    return visit((), n, 1)
+
+
+def shard_partitions(family, prefix, m, I):
+    if I is None:
+        return iter([prefix + (m,)])
+    return (prefix + p for p in GENERATORS[family](m, I))
+
+
+def map_shards(function, n, family="all", jobs=None, shard_size=None, batch_size=4096):
+    r"""Yield ``function(family, prefix, m, I)`` for all shards of ``n``, in
+    order, computed by a pool of ``jobs`` worker processes."""
+    tasks = (
+        (function, family) + shard for shard in shards(n, family, shard_size, jobs)
+    )
+    if jobs == 1:
+        yield from map(_call, tasks)
+        return
+    with Pool(jobs) as pool:
+        # hand out a bounded batch at a time, Pool.imap would queue all tasks
+        while batch := list(itertools.islice(tasks, batch_size)):
+            yield from pool.imap(_call, batch)
+
+
+def _call(task):
+    function, *arguments = task
+    return function(*arguments)
+
+
+def _shard_list(family, prefix, m, I):
+    return list(shard_partitions(family, prefix, m, I))
+
+
+def enumerate_parallel(n, family="all", jobs=None, shard_size=None):
+    r"""The partitions of ``n`` in ``family``, in the order of the generator,
+    generated by worker processes."""
+    for partitions_of_shard in map_shards(_shard_list, n, family, jobs, shard_size):
+        yield from partitions_of_shard
+
+
+def _count_shard(predicate, family, prefix, m, I):
+    return sum(1 for p in shard_partitions(family, prefix, m, I) if predicate(p))
+
+
+def count_where(predicate, n, family="all", jobs=None, shard_size=None):
+    r"""The number of partitions of ``n`` in ``family`` satisfying ``predicate``."""
+    return sum(map_shards(
+        functools.partial(_count_shard, predicate), n, family, jobs, shard_size
+    ))
+
+
+def _check_glaisher_shard(family, prefix, m, I):
+    r"""Number of partitions in the shard, or ``None`` if the image of one of
+    them is not a partition into odd parts that maps back to it."""
+    n = m + sum(prefix)
+    checked = 0
+    for partition in shard_partitions(family, prefix, m, I):
+        image = unique_to_odd(partition)
+        if sum(image) != n or not has_odd_parts(image) or odd_to_unique(image) != partition:
+            return None
+        checked += 1
+    return checked
+
+
+def check_glaisher(n, jobs=None, shard_size=None):
+    r"""Whether :func:`unique_to_odd` is a bijection from the partitions of
+    ``n`` into distinct parts to those into odd parts.
+
+    Every shard checks that its images are odd partitions of ``n`` and that
+    :func:`odd_to_unique` inverts the map on them, which makes the map
+    injective; it is then bijective as both sets have the same size.
+    """
+    total = 0
+    for checked in map_shards(_check_glaisher_shard, n, "distinct", jobs, shard_size):
+        if checked is None:
+            return False
+        total += checked
+    return total == count(n, "distinct") == count(n, "odd")
@@ -0,0 +1,166 @@
+r"""Stream partitions and Glaisher's bijection as JSON lines, CSV or binary.
+
+::
+
+    python -m manim_content.export 13 --family distinct
+    python -m manim_content.export 1 80 --family bijection --format csv --jobs 8
+
+Families are ``all``, ``distinct``, ``odd`` and ``bijection`` (pairs of a
+partition into distinct parts and its image under :func:`unique_to_odd`).
+Parts are listed in increasing order, the records appear in the order of
+the generators in :mod:`manim_content.combinatorics`.
+
+The binary format is a sequence of little-endian unsigned 16 bit integers:
+per record ``n``, then for every partition of the record its number of
+parts followed by the parts.
+
+Everything is generated lazily, so memory does not grow with the output.
+With ``--jobs``, the partitions are split into balanced shards by their
+leading (smallest) parts (see :mod:`manim_content.enumeration`), which are
+encoded by worker processes and written in order, or with ``--shard-dir``
+to one file per shard.
+"""
+import argparse
+import itertools
+import json
+import struct
+import sys
+from multiprocessing import Pool
+from pathlib import Path
+
+from manim_content.combinatorics import (
+    distinct_partitions, odd_partitions, partitions, unique_to_odd,
+)
+from manim_content.enumeration import shard_partitions, shards
+
+FAMILIES = {
+    "all": partitions,
+    "distinct": distinct_partitions,
+    "odd": odd_partitions,
+    "bijection": distinct_partitions,
+}
+FORMATS = ("jsonl", "csv", "binary")
+CSV_HEADERS = {
+    "bijection": "n,distinct,odd\n",
+}
+
+
+def records(n, family="all"):
+    r"""The records for ``n``: 1-tuples of partitions, or pairs
+    ``(distinct, odd)`` for the bijection."""
+    return _records(FAMILIES[family](n), family)
+
+
+def _records(partitions, family):
+    for partition in partitions:
+        if family == "bijection":
+            yield partition, unique_to_odd(partition)[::-1]
+        else:
+            yield (partition,)
+
+
+def encode(n, record, family, fmt):
+    r"""One record as ``bytes`` in the given format."""
+    if fmt == "binary":
+        values = [n]
+        for partition in record:
+            values.append(len(partition))
+            values.extend(partition)
+        return struct.pack(f"<{len(values)}H", *values)
+    if fmt == "csv":
+        return ",".join([str(n)] + [" ".join(map(str, p)) for p in record]).encode() + b"\n"
+    if family == "bijection":
+        data = {"n": n, "distinct": list(record[0]), "odd": list(record[1])}
+    else:
+        data = {"n": n, "partition": list(record[0])}
+    return json.dumps(data).encode() + b"\n"
+
+
+def _shard_family(family):
+    return "distinct" if family == "bijection" else family
+
+
+def _encode_shard(task):
+    n, family, fmt, prefix, m, I = task
+    return b"".join(
+        encode(n, record, family, fmt)
+        for record in _records(shard_partitions(_shard_family(family), prefix, m, I), family)
+    )
+
+
+def _write_shard(task):
+    path, *task = task
+    with open(path, "wb") as file:
+        file.write(_encode_shard(task))
+    return path
+
+
+def export(ns, family="all", fmt="jsonl", out=None, jobs=1, shard_size=None, batch_size=4096):
+    r"""Write the records for all ``n`` in ``ns`` to the binary stream ``out``."""
+    if out is None:
+        out = sys.stdout.buffer
+    if fmt == "csv":
+        out.write(CSV_HEADERS.get(family, "n,partition\n").encode())
+    if jobs == 1:
+        for n in ns:
+            for record in records(n, family):
+                out.write(encode(n, record, family, fmt))
+        return
+    tasks = (
+        (n, family, fmt) + shard
+        for n in ns for shard in shards(n, _shard_family(family), shard_size, jobs)
+    )
+    with Pool(jobs) as pool:
+        # hand out a bounded batch at a time, Pool.imap would queue all tasks
+        while batch := list(itertools.islice(tasks, batch_size)):
+            for chunk in pool.imap(_encode_shard, batch, chunksize=16):
+                out.write(chunk)
+
+
+def export_shards(ns, directory, family="all", fmt="jsonl", jobs=None, shard_size=None):
+    r"""Write the records for all ``n`` in ``ns`` to one file per shard in
+    ``directory``, named ``<n>-<shard index>.<fmt>``; concatenating them in
+    the order of their names gives the output of :func:`export` (without
+    the CSV header). Returns the paths of the files."""
+    directory = Path(directory)
+    directory.mkdir(parents=True, exist_ok=True)
+    tasks = (
+        (directory / f"{n:04d}-{index:06d}.{fmt}", n, family, fmt) + shard
+        for n in ns
+        for index, shard in enumerate(shards(n, _shard_family(family), shard_size, jobs))
+    )
+    with Pool(jobs) as pool:
+        return list(pool.imap_unordered(_write_shard, tasks, chunksize=4))
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        prog="python -m manim_content.export",
+        description="Stream partitions of n (or of all n in a range) to stdout.",
+    )
+    parser.add_argument("n", type=int)
+    parser.add_argument("last", type=int, nargs="?", help="export all n up to this value")
+    parser.add_argument("--family", choices=FAMILIES, default="all")
+    parser.add_argument("--format", choices=FORMATS, default="jsonl")
+    parser.add_argument("--jobs", type=int, default=1, help="number of worker processes")
+    parser.add_argument("--shard-size", type=int, default=None,
+                        help="maximal number of partitions per shard")
+    parser.add_argument("--shard-dir", default=None,
+                        help="write one file per shard to this directory instead of stdout")
+    args = parser.parse_args(argv)
+    last = args.n if args.last is None else args.last
+    if args.shard_dir is not None:
+        export_shards(range(args.n, last + 1), args.shard_dir, args.family, args.format,
+                      jobs=args.jobs, shard_size=args.shard_size)
+        return
+    try:
+        export(range(args.n, last + 1), args.family, args.format,
+               jobs=args.jobs, shard_size=args.shard_size)
+        sys.stdout.buffer.flush()
+    except BrokenPipeError:
+        # e.g. piped into head
+        sys.stderr.close()
+
+
+if __name__ == "__main__":
+    main()
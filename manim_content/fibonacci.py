@@ -0,0 +1,100 @@
+r"""Exact Fibonacci numbers and their exponential generating function.
+
+:math:`F(x) = \sum_{n\geq 0} f_n x^n/n!` as in ``Problem3`` and ``SolveODE``.
+The evaluators take NumPy grids and are cheap enough for per-frame
+updaters. This module does not import manim.
+"""
+import math
+from decimal import Decimal, localcontext
+
+import numpy as np
+
+SQRT5 = math.sqrt(5)
+LAMBDA_PLUS = (1 + SQRT5) / 2
+LAMBDA_MINUS = (1 - SQRT5) / 2
+
+
+def fibonacci_pair(n):
+    r"""The pair :math:`(f_n, f_{n+1})` by fast doubling, using
+    :math:`O(\log n)` big integer multiplications."""
+    if n < 0:
+        raise ValueError("n has to be non-negative")
+    a, b = 0, 1
+    for bit in bin(n)[2:]:
+        c = a * (2*b - a)
+        d = a*a + b*b
+        a, b = (d, c + d) if bit == "1" else (c, d)
+    return a, b
+
+
+def fibonacci(n):
+    return fibonacci_pair(n)[0]
+
+
+def fibonacci_sequence(count, start=0):
+    r"""The list :math:`f_{\text{start}}, \dots, f_{\text{start} + \text{count} - 1}`."""
+    a, b = fibonacci_pair(start)
+    numbers = []
+    for _ in range(count):
+        numbers.append(a)
+        a, b = b, a + b
+    return numbers
+
+
+def binet(n, digits=None):
+    r"""Binet's formula :math:`(\lambda_+^n - \lambda_-^n)/\sqrt{5}` evaluated
+    with ``digits`` significant decimal digits (enough to round to the exact
+    integer by default)."""
+    if digits is None:
+        digits = int(n * math.log10(LAMBDA_PLUS)) + 30
+    with localcontext() as context:
+        context.prec = digits
+        sqrt5 = Decimal(5).sqrt()
+        plus, minus = (1 + sqrt5) / 2, (1 - sqrt5) / 2
+        return (plus**n - minus**n) / sqrt5
+
+
+def check_binet(ns):
+    r"""Indices in ``ns`` where rounding Binet's formula does *not* give :math:`f_n`."""
+    return [n for n in ns if int(binet(n).to_integral_value()) != fibonacci(n)]
+
+
+def egf_terms(sequence, x, derivative=0):
+    r"""The terms :math:`s_{k+d}\, x^k/k!` for all ``k`` as an array of shape
+    ``(len(sequence) - d, *np.shape(x))``.
+
+    The terms are computed from logarithms, so huge exact integers in
+    ``sequence`` neither overflow nor lose their magnitude.
+    """
+    values = sequence[derivative:]
+    x = np.asarray(x, dtype=float)
+    k = np.arange(len(values)).reshape((-1,) + (1,)*x.ndim)
+    log_coefficients = np.array([
+        math.log(abs(s)) - math.lgamma(j + 1) if s else -np.inf
+        for j, s in enumerate(values)
+    ]).reshape(k.shape)
+    signs = np.array([(s > 0) - (s < 0) for s in values], dtype=float).reshape(k.shape)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        log_powers = np.where(k == 0, 0.0, k * np.log(np.abs(x)))
+        terms = np.exp(log_coefficients + log_powers)
+    x_signs = np.where(k % 2 == 1, np.sign(x), 1.0)
+    return np.nan_to_num(terms, nan=0.0) * signs * x_signs
+
+
+def egf_partial_sums(sequence, x, orders=None, derivative=0):
+    r"""Truncated EGFs :math:`\sum_{k < N} s_{k+d}\, x^k/k!` for each ``N`` in
+    ``orders`` (all truncation orders by default)."""
+    partial_sums = np.cumsum(egf_terms(sequence, x, derivative=derivative), axis=0)
+    if orders is None:
+        return partial_sums
+    return partial_sums[np.asarray(orders) - 1]
+
+
+def fibonacci_egf(x, derivative=0):
+    r"""Closed form of the ``derivative``-th derivative of the Fibonacci EGF,
+    :math:`(\lambda_+^d e^{\lambda_+ x} - \lambda_-^d e^{\lambda_- x})/\sqrt{5}`."""
+    x = np.asarray(x, dtype=float)
+    return (
+        LAMBDA_PLUS**derivative * np.exp(LAMBDA_PLUS * x)
+        - LAMBDA_MINUS**derivative * np.exp(LAMBDA_MINUS * x)
+    ) / SQRT5
@@ -0,0 +1,173 @@
+r"""Absorbing Markov chains: exact expectations and Monte Carlo estimates.
+
+Exact quantities are computed from the fundamental matrix
+:math:`N = (I - Q)^{-1}` in rational arithmetic, simulations run all trials
+at once with NumPy's random generator. This module does not import manim.
+"""
+from fractions import Fraction
+
+import numpy as np
+
+
+def _identity(size):
+    return [[Fraction(int(i == j)) for j in range(size)] for i in range(size)]
+
+
+def _inverse(matrix):
+    r"""Gauss-Jordan inversion of a square matrix with :class:`Fraction` entries."""
+    size = len(matrix)
+    work = [list(row) + unit_row for row, unit_row in zip(matrix, _identity(size))]
+    for col in range(size):
+        pivot = next((r for r in range(col, size) if work[r][col] != 0), None)
+        if pivot is None:
+            raise ValueError("matrix is singular, the chain has no absorbing path")
+        work[col], work[pivot] = work[pivot], work[col]
+        pivot_value = work[col][col]
+        work[col] = [entry / pivot_value for entry in work[col]]
+        for r in range(size):
+            if r != col and work[r][col] != 0:
+                factor = work[r][col]
+                work[r] = [a - factor*b for a, b in zip(work[r], work[col])]
+    return [row[size:] for row in work]
+
+
+def _matmul(a, b):
+    return [[sum(x*y for x, y in zip(row, col)) for col in zip(*b)] for row in a]
+
+
+class AbsorbingChain:
+    r"""A finite Markov chain with at least one absorbing state.
+
+    Parameters
+    ----------
+    matrix
+        Square transition matrix; ``matrix[i][j]`` is the probability of
+        moving from state ``i`` to state ``j``. Entries are converted to
+        :class:`~fractions.Fraction` (strings like ``"5/6"`` work too).
+    absorbing
+        Indices of the absorbing states.
+    start
+        The state every trial starts in.
+    """
+    def __init__(self, matrix, absorbing, start=0):
+        self.matrix = [[Fraction(entry) for entry in row] for row in matrix]
+        size = len(self.matrix)
+        if any(len(row) != size for row in self.matrix):
+            raise ValueError("transition matrix has to be square")
+        if any(sum(row) != 1 for row in self.matrix):
+            raise ValueError("rows of the transition matrix have to sum to 1")
+        self.absorbing = sorted(set(absorbing))
+        self.transient = [i for i in range(size) if i not in self.absorbing]
+        if start not in self.transient:
+            raise ValueError("the chain has to start in a transient state")
+        self.start = start
+        self._fundamental = None
+
+    @property
+    def Q(self):
+        return [[self.matrix[i][j] for j in self.transient] for i in self.transient]
+
+    @property
+    def R(self):
+        return [[self.matrix[i][j] for j in self.absorbing] for i in self.transient]
+
+    def fundamental_matrix(self):
+        r"""The matrix :math:`N = (I - Q)^{-1}`; ``N[i][j]`` is the expected
+        number of visits of transient state ``j`` when starting in ``i``."""
+        if self._fundamental is None:
+            size = len(self.transient)
+            identity = _identity(size)
+            self._fundamental = _inverse([
+                [identity[i][j] - q for j, q in enumerate(row)]
+                for i, row in enumerate(self.Q)
+            ])
+        return self._fundamental
+
+    def expected_steps(self):
+        r"""Expected number of steps until absorption, counting the
+        absorbing step, for the start state.
+
+        For "roll until you see a 1" this is the expected number of rolls
+        *including* the final 1, i.e. one more than the expectation
+        :math:`\mathbb{E}` computed in the video.
+        """
+        row = self.fundamental_matrix()[self.transient.index(self.start)]
+        return sum(row)
+
+    def absorption_probabilities(self):
+        r"""Probabilities of ending up in each of the absorbing states."""
+        row = self.fundamental_matrix()[self.transient.index(self.start)]
+        return [sum(n*r[k] for n, r in zip(row, self.R)) for k in range(len(self.absorbing))]
+
+    def absorption_time_distribution(self, max_steps):
+        r"""Exact probabilities ``P(T = k)`` for ``k = 0, ..., max_steps``."""
+        Q, R = self.Q, self.R
+        exit_probabilities = [sum(row) for row in R]
+        state = [[Fraction(int(t == self.start)) for t in self.transient]]
+        distribution = [Fraction(0)]
+        for _ in range(max_steps):
+            distribution.append(sum(s*e for s, e in zip(state[0], exit_probabilities)))
+            state = _matmul(state, Q)
+        return distribution
+
+    def simulate(self, trials, seed=None, max_steps=None):
+        r"""Simulate ``trials`` runs of the chain at once.
+
+        Returns an integer array with the absorption time of every trial;
+        trials that are still running after ``max_steps`` steps get ``-1``.
+        """
+        rng = np.random.default_rng(seed)
+        cumulative = np.cumsum(np.array(self.matrix, dtype=float), axis=1)
+        cumulative[:, -1] = 1.0
+        is_absorbing = np.zeros(len(self.matrix), dtype=bool)
+        is_absorbing[self.absorbing] = True
+
+        state = np.full(trials, self.start, dtype=np.intp)
+        times = np.zeros(trials, dtype=np.int64)
+        active = np.arange(trials)
+        step = 0
+        while active.size and (max_steps is None or step < max_steps):
+            u = rng.random(active.size)
+            next_state = (u[:, None] >= cumulative[state[active]]).sum(axis=1)
+            state[active] = next_state
+            step += 1
+            absorbed = is_absorbing[next_state]
+            times[active[absorbed]] = step
+            active = active[~absorbed]
+        times[active] = -1
+        return times
+
+
+def empirical_distribution(times, max_steps):
+    r"""Relative frequencies of the absorption times ``0, ..., max_steps``."""
+    times = np.asarray(times)
+    counts = np.bincount(times[times >= 0], minlength=max_steps + 1)[:max_steps + 1]
+    return counts / len(times)
+
+
+def running_mean(times):
+    r"""Sample means of the first ``1, 2, ..., len(times)`` simulated trials."""
+    times = np.asarray(times, dtype=float)
+    return np.cumsum(times) / np.arange(1, len(times) + 1)
+
+
+def roll_until(face_probabilities=None, target=1, run_length=1):
+    r"""The chain for rolling a die until ``target`` appeared
+    ``run_length`` times in a row.
+
+    ``face_probabilities`` maps faces to probabilities (a fair six-sided
+    die by default). State ``i`` is the length of the current run of
+    ``target``; state ``run_length`` is absorbing.
+    """
+    if face_probabilities is None:
+        face_probabilities = {face: Fraction(1, 6) for face in range(1, 7)}
+    face_probabilities = {face: Fraction(p) for face, p in face_probabilities.items()}
+    if sum(face_probabilities.values()) != 1:
+        raise ValueError("face probabilities have to sum to 1")
+    p = face_probabilities.get(target, Fraction(0))
+    matrix = [[Fraction(0)]*(run_length + 1) for _ in range(run_length + 1)]
+    for i in range(run_length):
+        matrix[i][i + 1] += p
+        matrix[i][0] += 1 - p
+    matrix[run_length][run_length] = Fraction(1)
+    return AbsorbingChain(matrix, absorbing=[run_length])
@@ -0,0 +1,108 @@
+r"""Disk cache for mobjects that are expensive to construct.
+
+::
+
+    @cached_mobject
+    def tableau_grid(n, width):
+        ...
+
+The return value of the decorated function is pickled, keyed by the
+function's qualified name, the ``repr`` of its arguments, hashes of the
+source file defining it and of all modules of :mod:`manim_content`, the
+TeX templates of :class:`~.MathTex` and :class:`~.Tex` and the manim
+version. Later runs, and other scenes calling the function with the same
+arguments, load the snapshot instead. Every call returns freshly
+unpickled objects, so scenes can modify them. Results that cannot be
+pickled (e.g. mobjects with lambda updaters) are simply rebuilt every
+time.
+
+In :mod:`~.draft` mode the cache is bypassed, so that placeholder glyphs
+never end up in a snapshot. Points shared by :mod:`~.copy_on_write`
+copies are unshared before pickling, since numpy would otherwise restore
+them as read-only arrays in scenes without copy-on-write.
+"""
+import functools
+import hashlib
+import inspect
+import os
+import pickle
+from pathlib import Path
+
+from manim import __version__ as manim_version
+from manim import MathTex, Mobject, Tex, config, logger
+
+from manim_content.copy_on_write import unshare_points
+from manim_content.draft import draft_mode_enabled
+from manim_content.tex_cache import default_tex_template, template_body
+
+PACKAGE_DIR = Path(__file__).resolve().parent
+
+
+def cache_dir():
+    return Path(config.media_dir) / "mobject_cache"
+
+
+@functools.lru_cache(maxsize=None)
+def _source_hash(path, mtime_ns):
+    return hashlib.sha256(Path(path).read_bytes()).hexdigest()
+
+
+def _file_hash(path):
+    return _source_hash(str(path), os.stat(path).st_mtime_ns)
+
+
+def cache_key(function, args, kwargs):
+    # the function may use anything from manim_content, e.g. DotLattice
+    sources = [inspect.getsourcefile(function), *sorted(PACKAGE_DIR.glob("*.py"))]
+    material = repr((
+        function.__module__, function.__qualname__, args, sorted(kwargs.items()),
+        [_file_hash(path) for path in sources],
+        [template_body(default_tex_template(cls)) for cls in (MathTex, Tex)],
+        manim_version,
+    ))
+    return hashlib.sha256(material.encode()).hexdigest()
+
+
+def _unshare(result):
+    r"""Give all mobjects in ``result`` (possibly nested in lists, tuples
+    and dictionaries) their own writeable points."""
+    if isinstance(result, Mobject):
+        unshare_points(result)
+    elif isinstance(result, (list, tuple)):
+        for item in result:
+            _unshare(item)
+    elif isinstance(result, dict):
+        for item in result.values():
+            _unshare(item)
+
+
+def cached_mobject(function):
+    r"""Decorator caching the (picklable) result of ``function`` on disk."""
+    snapshots = {}
+
+    @functools.wraps(function)
+    def wrapper(*args, **kwargs):
+        if draft_mode_enabled():
+            return function(*args, **kwargs)
+        key = cache_key(function, args, kwargs)
+        if key not in snapshots:
+            path = cache_dir() / f"{function.__qualname__}-{key[:20]}.pickle"
+            if path.exists():
+                snapshots[key] = path.read_bytes()
+            else:
+                result = function(*args, **kwargs)
+                _unshare(result)
+                try:
+                    data = pickle.dumps(result, protocol=pickle.HIGHEST_PROTOCOL)
+                except (pickle.PicklingError, TypeError, AttributeError) as error:
+                    logger.warning(f"not caching {function.__qualname__}: {error}")
+                    return result
+                path.parent.mkdir(parents=True, exist_ok=True)
+                temporary = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+                temporary.write_bytes(data)
+                os.replace(temporary, path)
+                snapshots[key] = data
+                return result
+        return pickle.loads(snapshots[key])
+
+    return wrapper
@@ -0,0 +1,661 @@
+r"""Mobjects shared between the scene scripts."""
+from fractions import Fraction
+from functools import cache, lru_cache
+
+import numpy as np
+from manim import (
+    DEFAULT_DOT_RADIUS, DEFAULT_STROKE_WIDTH, DOWN, LEFT, ORANGE, ORIGIN, RED, RIGHT, TAU, UP,
+    WHITE, YELLOW,
+    Arrow, Circle, Dot, MathTex, Square, VGroup, VMobject,
+    color_to_rgba, rgba_to_color,
+)
+from PIL import Image, ImageDraw
+
+from manim_content.combinatorics import partitions
+from manim_content.mobject_cache import cached_mobject
+from manim_content.style import BH_DARKGREEN
+from manim_content.tex_cache import math_tex
+
+
+def fraction_tex(value):
+    r"""LaTeX for a (rational) probability, e.g. ``\frac{5}{6}``."""
+    value = Fraction(value)
+    if value.denominator == 1:
+        return str(value.numerator)
+    return rf"\frac{{{value.numerator}}}{{{value.denominator}}}"
+
+
+class ChainDiagram(VGroup):
+    r"""Diagram of an experiment that is repeated with probability
+    ``p_continue`` and stops with probability ``p_stop``, drawn for
+    ``length`` steps (the last step fades into ``\cdots``).
+
+    The parts are available as ``dots``, ``arrows_right``, ``arrows_down``,
+    ``continue_labels``, ``stop_labels``, ``outcomes`` and ``etc``.
+    """
+    def __init__(self, length, p_continue, p_stop, outcome_gradient=(WHITE, ORANGE),
+                 label_font_size=36, **kwargs):
+        N = length
+        self.dots = VGroup(*[Dot() for i in range(N)]).arrange(RIGHT, buff=2)
+        self.arrows_right = VGroup(*[Arrow(self.dots[i], self.dots[i+1], buff=0.2) for i in range(N-1)])
+        self.continue_labels = VGroup(*[
+            math_tex(fraction_tex(p_continue), font_size=label_font_size).next_to(self.arrows_right[i], UP)
+            for i in range(N-1)
+        ])
+        self.dots[-1].set_opacity(0)
+        self.arrows_right[-1].set_opacity(0.5)
+        self.continue_labels[-1].set_opacity(0.5)
+        self.etc = MathTex(r"\cdots").move_to(self.dots[-1]).shift(RIGHT*0.25).set_opacity(0.25)
+        self.outcomes = VGroup(*[
+            MathTex(str(i)).move_to(self.dots[i]).shift(2*DOWN + 0.75*RIGHT) for i in range(N-1)
+        ]).set_color_by_gradient(*outcome_gradient)
+        self.arrows_down = VGroup(*[Arrow(self.dots[i], self.outcomes[i], buff=0.2) for i in range(N-1)])
+        self.stop_labels = VGroup(*[
+            math_tex(fraction_tex(p_stop), font_size=label_font_size).next_to(self.arrows_down[i], RIGHT)
+            for i in range(N-1)
+        ])
+        super().__init__(
+            self.dots, self.arrows_right, self.arrows_down,
+            self.continue_labels, self.stop_labels, self.outcomes, self.etc,
+            **kwargs
+        )
+        self.center()
+
+    @classmethod
+    def from_chain(cls, chain, length, **kwargs):
+        r"""Diagram for an :class:`~.markov.AbsorbingChain` with a single
+        transient state, such as :func:`~.markov.roll_until`."""
+        if len(chain.transient) != 1:
+            raise ValueError("only chains with a single transient state can be drawn")
+        state = chain.transient[0]
+        p_continue = chain.matrix[state][state]
+        return cls(length, p_continue, 1 - p_continue, **kwargs)
+
+
+def plot_family(axes, function, parameters, x_range=None, use_smoothing=True, **kwargs):
+    r"""Plot the curves ``t -> function(p, t)`` for every ``p`` in ``parameters``.
+
+    ``function`` has to be vectorized: it is called once with a column of
+    parameters and a row of sample points and returns all curves at once.
+    The sampling matches :meth:`~.Axes.plot`. Returns a :class:`~.VGroup`
+    with one curve per parameter; ``kwargs`` are passed to every curve.
+    """
+    x_min, x_max, x_step = np.array(axes.x_range, dtype=float)
+    if x_range is not None:
+        x_min, x_max = x_range[:2]
+        x_step = x_range[2] if len(x_range) > 2 else x_step / 10
+    else:
+        x_step /= 10
+    t = np.append(np.arange(x_min, x_max, x_step), x_max)
+    parameters = np.asarray(parameters, dtype=float)
+    values = np.broadcast_to(function(parameters[:, None], t[None, :]), (len(parameters), len(t)))
+
+    # linear axes are affine, so three calls to c2p suffice for all samples
+    origin = axes.c2p(0, 0)
+    x_unit, y_unit = axes.c2p(1, 0) - origin, axes.c2p(0, 1) - origin
+    points = origin + t[None, :, None] * x_unit + values[:, :, None] * y_unit
+
+    curves = VGroup()
+    for curve_points in points:
+        curve = VMobject(**kwargs).set_points_as_corners(curve_points)
+        if use_smoothing:
+            curve.make_smooth()
+        curves.add(curve)
+    return curves
+
+
+@cache
+def _unit_circle_points():
+    return Circle(radius=1).points.copy()
+
+
+def _index_sets(values):
+    indices = {}
+    for index, value in enumerate(values):
+        indices.setdefault(value, []).append(index)
+    return {value: np.array(members) for value, members in indices.items()}
+
+
+class DotLattice(VGroup):
+    r"""Many dots at the given ``positions``, labeled by lattice
+    ``coordinates`` ``(x, y)``.
+
+    Instead of one :class:`~.Dot` per point, all dots of the same color are
+    closed subpaths of a single :class:`~.VMobject`, so that the lattice
+    consists of only a handful of submobjects. Colors and radii can be given
+    per point. ``rows``, ``columns`` and ``diagonals`` map ``y``, ``x`` and
+    ``y - x`` to arrays of point indices, and ``index`` maps coordinates to
+    the index of their point.
+
+    To animate some of the points on their own, :meth:`split` (or
+    :meth:`select`) regroups the lattice such that the chosen points form
+    separate submobjects.
+    """
+    def __init__(self, coordinates, positions, color=WHITE, radius=DEFAULT_DOT_RADIUS,
+                 colors=None, radii=None, fill_opacity=1.0, **kwargs):
+        super().__init__(**kwargs)
+        self.coordinates = [tuple(c) for c in coordinates]
+        self.index = {c: i for i, c in enumerate(self.coordinates)}
+        self.rows = _index_sets(y for x, y in self.coordinates)
+        self.columns = _index_sets(x for x, y in self.coordinates)
+        self.diagonals = _index_sets(y - x for x, y in self.coordinates)
+
+        count = len(self.coordinates)
+        positions = np.asarray(positions, dtype=float).reshape(count, 3)
+        radii = np.full(count, radius, dtype=float) if radii is None else np.asarray(radii, dtype=float)
+        colors = [color] * count if colors is None else colors
+        rgbas = np.array([color_to_rgba(c, fill_opacity) for c in colors]).reshape(count, 4)
+        blocks = positions[:, None, :] + radii[:, None, None] * _unit_circle_points()[None, :, :]
+        self._regroup([], blocks, rgbas)
+
+    @classmethod
+    def from_axes(cls, axes, coordinates, **kwargs):
+        r"""Lattice with the point with coordinates ``(x, y)`` at ``axes.c2p(x, y)``."""
+        coordinates = [tuple(c) for c in coordinates]
+        # linear axes are affine, see plot_family
+        origin = axes.c2p(0, 0)
+        x_unit, y_unit = axes.c2p(1, 0) - origin, axes.c2p(0, 1) - origin
+        xy = np.array(coordinates, dtype=float).reshape(-1, 2)
+        return cls(coordinates, origin + xy[:, :1] * x_unit + xy[:, 1:] * y_unit, **kwargs)
+
+    def _gather(self):
+        r"""Current circle points (one block per point) and fill colors."""
+        count = len(self.coordinates)
+        blocks = np.empty((count, len(_unit_circle_points()), 3))
+        rgbas = np.empty((count, 4))
+        for piece in self.submobjects:
+            indices = piece.lattice_indices
+            blocks[indices] = piece.points.reshape(len(indices), -1, 3)
+            rgbas[indices] = piece.get_fill_rgbas()[0]
+        return blocks, rgbas
+
+    def _regroup(self, groups, blocks, rgbas):
+        owner = np.full(len(self.coordinates), -1)
+        for number, indices in enumerate(groups):
+            if (owner[indices] >= 0).any():
+                raise ValueError("the groups of points have to be disjoint")
+            owner[indices] = number
+        pieces, selections = [], [VGroup() for _ in groups]
+        for number in range(-1, len(groups)):
+            members = np.flatnonzero(owner == number)
+            buckets = {}
+            for index in members:
+                buckets.setdefault(tuple(np.round(rgbas[index], 6)), []).append(index)
+            for indices in buckets.values():
+                indices = np.array(indices)
+                piece = VMobject(stroke_width=0)
+                piece.set_points(blocks[indices].reshape(-1, 3))
+                piece.set_fill(rgba_to_color(rgbas[indices[0]]), opacity=rgbas[indices[0], 3])
+                piece.lattice_indices = indices
+                pieces.append(piece)
+                if number >= 0:
+                    selections[number].add(piece)
+        self.submobjects = []
+        self.add(*pieces)
+        return selections
+
+    def split(self, *groups):
+        r"""Regroup the submobjects such that the points in each of the
+        (disjoint) index arrays ``groups`` form their own submobjects, drawn
+        above the remaining points. Returns one :class:`~.VGroup` per group.
+
+        Without arguments, all points are merged by color again.
+        """
+        groups = [np.asarray(indices, dtype=int).reshape(-1) for indices in groups]
+        return self._regroup(groups, *self._gather())
+
+    def select(self, indices):
+        return self.split(indices)[0]
+
+    def set_point_colors(self, indices, color, opacity=1.0):
+        blocks, rgbas = self._gather()
+        rgbas[np.asarray(indices, dtype=int)] = color_to_rgba(color, opacity)
+        self._regroup([], blocks, rgbas)
+        return self
+
+    def get_point_centers(self):
+        return self._gather()[0].mean(axis=1)
+
+    def get_point_radii(self):
+        blocks = self._gather()[0]
+        return np.linalg.norm(blocks[:, 0] - blocks.mean(axis=1), axis=1)
+
+    def get_point_rgbas(self):
+        return self._gather()[1]
+
+
+def arc_points(starts, ends, angles, num_components=9):
+    r"""Bézier points of circular arcs from ``starts`` to ``ends`` that turn
+    by ``angles``, like :class:`~.ArcBetweenPoints`, as an array of shape
+    ``(len(starts), 4 * (num_components - 1), 3)``.
+
+    In the complex plane, the arc is the image of the unit circle arc from
+    :math:`1` to :math:`e^{i\theta}` under
+    :math:`z \mapsto A + (z - 1)(B - A)/(e^{i\theta} - 1)`; handles have the
+    length :math:`\frac{4}{3}\tan(\Delta\theta/4)` before mapping.
+    """
+    starts = np.asarray(starts, dtype=float).reshape(-1, 3)
+    ends = np.asarray(ends, dtype=float).reshape(-1, 3)
+    angles = np.broadcast_to(np.asarray(angles, dtype=float), (len(starts),))
+    curves = num_components - 1
+    s = np.linspace(0, 1, num_components)[None, :]
+    straight = (np.abs(angles) < 1e-8)[:, None]
+    theta = np.where(straight, 1.0, angles[:, None])
+    denominator = np.exp(1j * theta) - 1
+    # position on the chord and handle offset; both tend to the straight line
+    along = np.where(straight, s, (np.exp(1j * theta * s) - 1) / denominator)
+    handle = np.where(
+        straight, 1 / (3 * curves),
+        4/3 * np.tan(theta / (4 * curves)) * 1j * np.exp(1j * theta * s) / denominator,
+    )
+    a = starts[:, 0] + 1j * starts[:, 1]
+    chord = (ends[:, 0] + 1j * ends[:, 1] - a)[:, None]
+    anchors = a[:, None] + along * chord
+    bezier = np.stack([
+        anchors[:, :-1],
+        anchors[:, :-1] + handle[:, :-1] * chord,
+        anchors[:, 1:] - handle[:, 1:] * chord,
+        anchors[:, 1:],
+    ], axis=2).reshape(len(starts), -1)
+    z = np.stack([s[:, :-1], s[:, :-1], s[:, 1:], s[:, 1:]], axis=2).reshape(1, -1)
+    z = starts[:, 2:] + z * (ends[:, 2:] - starts[:, 2:])
+    return np.stack([bezier.real, bezier.imag, z], axis=-1)
+
+
+class ArcBundle(VGroup):
+    r"""Circular arcs from ``starts`` to ``ends`` (see :func:`arc_points`).
+
+    Arcs with the same stroke are subpaths of one :class:`~.VMobject`, so
+    thousands of arcs are only a handful of submobjects. Stroke colors,
+    opacities and widths can be given per arc via ``colors``,
+    ``opacities`` and ``widths``. Use :class:`~.animations.CreateArcs` to
+    draw them.
+    """
+    def __init__(self, starts, ends, angle=TAU/4, color=WHITE, stroke_opacity=1.0,
+                 stroke_width=DEFAULT_STROKE_WIDTH, angles=None, colors=None, opacities=None,
+                 widths=None, num_components=9, **kwargs):
+        super().__init__(**kwargs)
+        points = arc_points(starts, ends, angle if angles is None else angles, num_components)
+        count = len(points)
+        colors = [color] * count if colors is None else colors
+        opacities = np.full(count, stroke_opacity) if opacities is None else opacities
+        widths = np.full(count, stroke_width, dtype=float) if widths is None else widths
+        rgbas = np.array([color_to_rgba(c, o) for c, o in zip(colors, opacities)]).reshape(count, 4)
+
+        buckets = {}
+        for index in range(count):
+            key = (tuple(np.round(rgbas[index], 6)), float(widths[index]))
+            buckets.setdefault(key, []).append(index)
+        for (rgba, width), indices in buckets.items():
+            indices = np.array(indices)
+            piece = VMobject(fill_opacity=0)
+            piece.set_points(points[indices].reshape(-1, 3))
+            piece.set_stroke(rgba_to_color(rgba), width=width, opacity=rgba[3])
+            piece.arc_indices = indices
+            self.add(piece)
+        self.arc_count = count
+
+    def get_arc_points(self):
+        r"""The points of all arcs, shape ``(arc_count, points_per_arc, 3)``."""
+        arcs = None
+        for piece in self.submobjects:
+            piece_points = piece.points.reshape(len(piece.arc_indices), -1, 3)
+            if arcs is None:
+                arcs = np.empty((self.arc_count,) + piece_points.shape[1:])
+            arcs[piece.arc_indices] = piece_points
+        return arcs
+
+    def set_arc_points(self, arcs):
+        for piece in self.submobjects:
+            piece.points = arcs[piece.arc_indices].reshape(-1, 3)
+        return self
+
+
+class YoungTableau(VMobject):
+    r"""Young diagram of the partition with the given ``parts``, with one
+    :class:`~.Square` per cell and the rows left-aligned from top to bottom.
+
+    Implements ``get_lod_extent`` and ``get_lod_sprite``, so that
+    :class:`~.camera.LODCamera` can draw small tableaux as sprites.
+    """
+    def __init__(self, *parts, square_length=1, **kwargs):
+        super().__init__(**kwargs)
+        self.integer_parts = parts
+        self.lod_changes = CellChanges()
+        self._lod_extent = None
+        self._lod_colors = None
+        self._lod_style_seen = None
+        part_groups = [
+            VGroup(*[
+                TableauCell(self.lod_changes, side_length=square_length) for x in range(part)
+            ]).arrange(RIGHT, buff=0)
+            for part in parts
+        ]
+        VGroup(*part_groups).arrange(DOWN, buff=0)
+        for part_group in part_groups[1:]:
+            part_group.set_x(part_groups[0].get_x(LEFT), LEFT)
+        for part_group in part_groups:
+            for part in part_group:
+                self.add(part)
+
+    def get_extent(self):
+        r"""Upper left corner, width and height of the tableau, computed
+        from its parts and the first square instead of from all points."""
+        square = self.submobjects[0].points
+        side = np.ptp(square[:, 0])
+        corner = np.array([square[:, 0].min(), square[:, 1].max(), 0])
+        return corner, side * max(self.integer_parts), side * len(self.integer_parts)
+
+    def get_lod_extent(self):
+        r"""Extent for :class:`~.LODCamera`, or ``None`` while the squares do
+        not form an axis-aligned grid (e.g. while being written).
+
+        The result is kept until the points of a square change, so still
+        tableaux cost nothing per frame.
+        """
+        version = (self.lod_changes.points, len(self.submobjects))
+        if self._lod_extent is None or self._lod_extent[0] != version:
+            self._lod_extent = (version, self._compute_lod_extent())
+        return self._lod_extent[1]
+
+    def _compute_lod_extent(self):
+        corner, width, height = self.get_extent()
+        try:
+            points = np.array([square.points for square in self.submobjects])
+        except ValueError:
+            return None
+        if points.ndim != 3 or points.shape[1] == 0:
+            return None
+        side = width / max(self.integer_parts)
+        rows, cols = cell_positions(self.integer_parts)
+        expected = corner[:2] + np.c_[cols * side, -rows * side]
+        lows, highs = points.min(axis=1), points.max(axis=1)
+        if not (np.allclose(np.c_[lows[:, 0], highs[:, 1]], expected, atol=1e-3 * side)
+                and np.allclose(highs[:, :2] - lows[:, :2], side, atol=1e-3 * side)):
+            return None
+        return corner, width, height
+
+    def get_lod_sprite(self, pixel_width, pixel_height, pixels_per_unit):
+        r"""Sprite for :class:`~.LODCamera`, or ``None`` while the colors of
+        the squares are changing (e.g. during a fade), so that animations
+        are drawn as paths instead of rasterizing a new sprite every frame."""
+        def to_bytes(rgbas):
+            return np.round(np.array(rgbas) * 255).astype(np.uint8).tobytes()
+
+        style = (self.lod_changes.style, len(self.submobjects))
+        previous, self._lod_style_seen = self._lod_style_seen, style
+        if style != previous:
+            return None
+        squares = self.submobjects
+        if self._lod_colors is None or self._lod_colors[0] != style:
+            self._lod_colors = (
+                style,
+                to_bytes([square.get_fill_rgbas()[0] for square in squares]),
+                to_bytes([square.get_stroke_rgbas()[0] for square in squares]),
+                squares[0].get_stroke_width(),
+            )
+        _, fills, strokes, stroke_width = self._lod_colors
+        return tableau_sprite(
+            tuple(self.integer_parts), fills, strokes, pixel_width, pixel_height,
+            round(stroke_width * 0.01 * pixels_per_unit, 1),
+        )
+
+
+class CellChanges:
+    r"""Counters of the changes to the points and to the style of the
+    squares of one :class:`YoungTableau`."""
+    def __init__(self):
+        self.points = 0
+        self.style = 0
+
+
+class TableauCell(Square):
+    r"""A square of a :class:`YoungTableau` that counts every assignment of
+    its points and style attributes (including the ``-=`` of
+    :meth:`~.Mobject.apply_points_function_about_point`) and every color
+    update in ``changes``, a :class:`CellChanges` shared by the tableau."""
+    STYLE_ATTRIBUTES = frozenset({
+        "fill_rgbas", "stroke_rgbas", "stroke_width",
+        "background_stroke_rgbas", "background_stroke_width",
+    })
+
+    def __init__(self, changes, **kwargs):
+        self.lod_changes = changes
+        super().__init__(**kwargs)
+
+    def __setattr__(self, name, value):
+        super().__setattr__(name, value)
+        changes = self.__dict__.get("lod_changes")
+        if changes is None:
+            return
+        if name == "points":
+            changes.points += 1
+        elif name in self.STYLE_ATTRIBUTES:
+            changes.style += 1
+
+    def update_rgbas_array(self, *args, **kwargs):
+        # set_fill, set_stroke and set_opacity write into the arrays in place
+        result = super().update_rgbas_array(*args, **kwargs)
+        changes = self.__dict__.get("lod_changes")
+        if changes is not None:
+            changes.style += 1
+        return result
+
+
+@lru_cache(maxsize=None)
+def cell_positions(parts):
+    r"""Row and column of every square of the tableau with the given parts."""
+    rows = np.repeat(np.arange(len(parts)), parts)
+    cols = np.concatenate([np.arange(part) for part in parts])
+    return rows, cols
+
+
+@lru_cache(maxsize=4096)
+def tableau_sprite(parts, fills, strokes, width, height, line_width, supersample=4):
+    r"""RGBA pixels of a tableau drawn ``width`` x ``height`` pixels large,
+    with a margin of half the line width around it. ``fills`` and
+    ``strokes`` are the bytes of one RGBA color per square."""
+    fills = np.frombuffer(fills, dtype=np.uint8).reshape(-1, 4)
+    strokes = np.frombuffer(strokes, dtype=np.uint8).reshape(-1, 4)
+    margin = int(np.ceil(line_width / 2))
+    image = Image.new(
+        "RGBA", ((width + 2*margin) * supersample, (height + 2*margin) * supersample), (0, 0, 0, 0)
+    )
+    draw = ImageDraw.Draw(image)
+    cell_x = width / max(parts) * supersample
+    cell_y = height / len(parts) * supersample
+    line = round(line_width * supersample)
+    for fill, stroke, row, col in zip(fills, strokes, *cell_positions(parts)):
+        x0, y0 = (margin * supersample + col * cell_x, margin * supersample + row * cell_y)
+        x1, y1 = x0 + cell_x, y0 + cell_y
+        draw.rectangle([x0, y0, x1, y1], fill=tuple(fill))
+        if line > 0:
+            draw.line([(x0, y0), (x1, y0), (x1, y1), (x0, y1), (x0, y0)],
+                      fill=tuple(stroke), width=line, joint="curve")
+    return np.asarray(image.reduce(supersample))
+
+
+def grid_shape(widths, heights, buff, aspect):
+    r"""Rows and columns of the row-major grid whose width to height ratio
+    is closest to ``aspect``."""
+    count = len(widths)
+    best = None
+    for cols in range(1, count + 1):
+        rows = -(-count // cols)
+        padded = np.arange(rows * cols)
+        cell_widths = np.where(padded < count, np.resize(widths, rows * cols), 0).reshape(rows, cols)
+        cell_heights = np.where(padded < count, np.resize(heights, rows * cols), 0).reshape(rows, cols)
+        grid_width = cell_widths.max(axis=0).sum() + (cols - 1) * buff[0]
+        grid_height = cell_heights.max(axis=1).sum() + (rows - 1) * buff[1]
+        error = abs(np.log(grid_width / grid_height / aspect))
+        if best is None or error < best[0]:
+            best = (error, rows, cols)
+    return best[1:]
+
+
+def arrange_tableaux(tableaux, rows=None, cols=None, buff=1, width=None, height=None, aspect=None):
+    r"""Arrange a group of :class:`YoungTableau` like
+    ``arrange_in_grid(rows, cols, buff)`` followed by fitting the grid into
+    ``width`` and/or ``height``, but compute all sizes from the parts.
+
+    With ``aspect`` (and no ``rows``/``cols``), the grid shape with the
+    closest width to height ratio is chosen. All squares are moved in a
+    single vectorized transformation.
+    """
+    buff = np.array(buff if isinstance(buff, tuple) else (buff, buff), dtype=float)
+    extents = [tableau.get_extent() for tableau in tableaux]
+    corners = np.array([corner for corner, _, _ in extents])
+    sizes = np.array([(w, h) for _, w, h in extents])
+    centers = corners + np.c_[sizes[:, 0] / 2, -sizes[:, 1] / 2, np.zeros(len(sizes))]
+    group_center = np.array([
+        (corners[:, 0].min() + (corners[:, 0] + sizes[:, 0]).max()) / 2,
+        (corners[:, 1].max() + (corners[:, 1] - sizes[:, 1]).min()) / 2,
+        0,
+    ])
+
+    count = len(extents)
+    if rows is None and cols is None:
+        if aspect is not None:
+            rows, cols = grid_shape(sizes[:, 0], sizes[:, 1], buff, aspect)
+        else:
+            rows = int(np.ceil(np.sqrt(count)))
+    if cols is None:
+        cols = -(-count // rows)
+    elif rows is None:
+        rows = -(-count // cols)
+
+    row, col = np.divmod(np.arange(count), cols)
+    col_widths = np.zeros(cols)
+    row_heights = np.zeros(rows)
+    np.maximum.at(col_widths, col, sizes[:, 0])
+    np.maximum.at(row_heights, row, sizes[:, 1])
+    col_x = np.cumsum(col_widths + buff[0]) - col_widths / 2 - buff[0]
+    row_y = -(np.cumsum(row_heights + buff[1]) - row_heights / 2 - buff[1])
+    grid_width = col_widths.sum() + (cols - 1) * buff[0]
+    grid_height = row_heights.sum() + (rows - 1) * buff[1]
+    cell_centers = np.c_[col_x[col] - grid_width / 2, row_y[row] + grid_height / 2, np.zeros(count)]
+
+    scales = []
+    if width is not None:
+        scales.append(width / grid_width)
+    if height is not None:
+        scales.append(height / grid_height)
+    scale = min(scales, default=1)
+    targets = group_center + scale * cell_centers
+
+    squares = [square for tableau in tableaux for square in tableau.submobjects]
+    lengths = [len(square.points) for square in squares]
+    owners = np.repeat(
+        np.repeat(np.arange(count), [len(tableau.submobjects) for tableau in tableaux]),
+        lengths,
+    )
+    points = np.concatenate([square.points for square in squares])
+    points = (points - centers[owners]) * scale + targets[owners]
+    for square, square_points in zip(squares, np.split(points, np.cumsum(lengths)[:-1])):
+        square.points = square_points
+    return tableaux
+
+
+@cached_mobject
+def enumeration_tableaux(n):
+    r"""Colored tableaux of all partitions of ``n`` (in the order they are
+    enumerated) together with faint background copies of them."""
+    pts = sorted(partitions(n), reverse=True, key=lambda pt: pt[::-1])
+    yts = [
+        YoungTableau(*partition[::-1], square_length=1)\
+            .set_submobject_colors_by_gradient(RED, YELLOW)\
+            .set_style(stroke_color=BH_DARKGREEN, fill_opacity=1)
+        for partition in pts]
+    yts_bg = VGroup(*[yt.copy().set_style(stroke_width=2, fill_color=WHITE, fill_opacity=0.1) for yt in yts])
+    return yts, yts_bg
+
+
+class YoungDiagramOutline(VMobject):
+    r"""The Young diagram of a partition as a single filled polygon along its
+    boundary, with two corners per distinct part; the cost of drawing it
+    does not depend on the number of cells.
+
+    ``partition`` is a sequence of parts or a dictionary
+    ``{part: multiplicity}``. With ``orientation="english"`` the rows hang
+    down from the upper left corner like in :class:`YoungTableau`,
+    ``"french"`` stacks them upwards and ``"russian"`` turns the french
+    diagram by 45 degrees. The corner of the first row and column is
+    placed at ``ORIGIN``.
+
+    To morph between diagrams, :func:`align_outlines` them first.
+    """
+    ORIENTATIONS = {
+        "english": np.array([[1, 0], [0, 1]]),
+        "french": np.array([[1, 0], [0, -1]]),
+        "russian": np.array([[1, 1], [1, -1]]) / np.sqrt(2),
+    }
+
+    def __init__(self, partition, square_length=1, orientation="english", fill_opacity=1, **kwargs):
+        super().__init__(fill_opacity=fill_opacity, **kwargs)
+        self.square_length = square_length
+        self.orientation = orientation
+        self.set_outline(outline_corners(partition))
+
+    def set_outline(self, corners):
+        r"""Set the polygon from corners in cell units (english orientation),
+        keeping the position of the first corner."""
+        anchor = self.points[0].copy() if self.has_points() else ORIGIN
+        self.corners = np.asarray(corners, dtype=float)
+        planar = self.corners @ self.ORIENTATIONS[self.orientation].T * self.square_length
+        points = np.zeros((len(planar) + 1, 3))
+        points[:-1, :2] = planar
+        points[-1, :2] = planar[0]
+        self.set_points_as_corners(points + anchor - points[0])
+        return self
+
+    def get_outline_fractions(self):
+        r"""The corners' positions along the closed boundary, in :math:`[0, 1)`."""
+        return outline_fractions(self.corners)
+
+    def resample(self, fractions):
+        r"""Use the boundary points at the given ``fractions`` as corners."""
+        return self.set_outline(resample_outline(self.corners, fractions))
+
+
+def outline_corners(partition):
+    r"""The corners of the Young diagram of ``partition`` in cell units
+    (english orientation), clockwise from the upper left corner at the
+    origin."""
+    if isinstance(partition, dict):
+        items = sorted(((part, m) for part, m in partition.items() if m), reverse=True)
+    else:
+        parts, multiplicities = np.unique(np.asarray(partition, dtype=int), return_counts=True)
+        items = list(zip(parts[::-1], multiplicities[::-1]))
+    parts = np.array([part for part, _ in items], dtype=float)
+    depths = np.cumsum([m for _, m in items], dtype=float)
+    corners = np.zeros((2 * len(items) + 2, 2))
+    corners[1:-1:2, 0] = parts
+    corners[1:-1:2, 1] = -np.concatenate([[0], depths[:-1]])
+    corners[2:-1:2, 0] = parts
+    corners[2:-1:2, 1] = -depths
+    corners[-1, 1] = -depths[-1] if len(depths) else 0
+    return corners
+
+
+def outline_fractions(corners):
+    closed = np.vstack([corners, corners[:1]])
+    lengths = np.cumsum(np.linalg.norm(np.diff(closed, axis=0), axis=1))
+    return np.concatenate([[0], lengths[:-1]]) / lengths[-1]
+
+
+def resample_outline(corners, fractions):
+    closed = np.vstack([corners, corners[:1]])
+    arc = np.concatenate([[0], np.cumsum(np.linalg.norm(np.diff(closed, axis=0), axis=1))])
+    targets = np.asarray(fractions) * arc[-1]
+    return np.stack([np.interp(targets, arc, closed[:, i]) for i in range(2)], axis=1)
+
+
+def align_outlines(*outlines):
+    r"""Give all ``outlines`` corners at the same fractions of their
+    boundaries (the union of all their corners), so that a
+    :class:`~.Transform` between them moves every corner along a straight
+    line instead of matching up unrelated curves."""
+    fractions = np.unique(np.concatenate([o.get_outline_fractions() for o in outlines]))
+    for outline in outlines:
+        outline.resample(fractions)
+    return outlines
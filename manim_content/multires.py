@@ -0,0 +1,264 @@
+r"""Render a scene once and write it at several resolutions.
+
+::
+
+    python -m manim_content.multires 2022-04_partitions.py YTEnumeration \
+        3840x2160@60 1920x1080@60 854x480@15 --still 1280x720
+
+The scene is rendered by manim at the largest requested size and the
+highest frame rate. Every frame is additionally downscaled (by block
+averages with numpy for integer factors, otherwise with Pillow) for the
+other outputs and handed to one ffmpeg process per output, each fed by
+its own thread, so all encoders run next to the render. Lower frame rates
+keep every k-th frame and have to divide the highest one. ``--still``
+saves the last frame as a PNG of the given size, e.g. for thumbnails.
+
+The outputs are written to ``<media_dir>/multires``. Caching of partial
+movie files is disabled for these renders, since cached animations would
+not pass through the frame hook.
+"""
+import argparse
+import queue
+import re
+import shutil
+import subprocess
+import threading
+from pathlib import Path
+
+import numpy as np
+from manim import config, logger, tempconfig
+
+OUTPUT_SPEC = re.compile(r"^(\d+)x(\d+)(?:@(\d+))?$")
+
+
+class Output:
+    r"""A requested output of ``width`` by ``height`` pixels at ``frame_rate``
+    frames per second (``None`` for a still image)."""
+    def __init__(self, width, height, frame_rate=None):
+        self.width = width
+        self.height = height
+        self.frame_rate = frame_rate
+
+    @classmethod
+    def parse(cls, spec, still=False):
+        match = OUTPUT_SPEC.match(spec)
+        if match is None:
+            raise argparse.ArgumentTypeError(f"expected WIDTHxHEIGHT@FPS, got {spec!r}")
+        width, height, frame_rate = match.groups()
+        if still:
+            return cls(int(width), int(height))
+        return cls(int(width), int(height), int(frame_rate or 60))
+
+    @property
+    def size(self):
+        return self.width, self.height
+
+    def file_name(self, scene_name):
+        if self.frame_rate is None:
+            return f"{scene_name}_{self.width}x{self.height}.png"
+        return f"{scene_name}_{self.width}x{self.height}_{self.frame_rate}fps.mp4"
+
+
+def downscale(frame, width, height):
+    r"""Downscale the RGBA ``frame`` to ``width`` by ``height`` pixels."""
+    source_height, source_width = frame.shape[:2]
+    if (source_width, source_height) == (width, height):
+        return frame
+    factor, remainder = divmod(source_width, width)
+    if remainder == 0 and factor * height == source_height and factor <= 16:
+        # sums of up to 16 * 16 bytes fit into uint16
+        total = np.full((height, width, frame.shape[2]), factor * factor // 2, dtype=np.uint16)
+        for i in range(factor):
+            for j in range(factor):
+                total += frame[i::factor, j::factor]
+        total //= factor * factor
+        return total.astype(np.uint8)
+    from PIL import Image
+
+    image = Image.fromarray(np.ascontiguousarray(frame), "RGBA")
+    return np.asarray(image.resize((width, height), Image.Resampling.BOX))
+
+
+class Encoder:
+    r"""An ffmpeg process encoding raw RGBA frames from a queue to ``path``.
+
+    If ffmpeg fails, e.g. on an unsupported size, the next :meth:`write`
+    raises instead of waiting for the full queue forever.
+    """
+    def __init__(self, path, width, height, frame_rate, queue_size=16):
+        self.path = path
+        self.error = None
+        command = [
+            "ffmpeg", "-y", "-loglevel", "error",
+            "-f", "rawvideo", "-pix_fmt", "rgba", "-s", f"{width}x{height}",
+            "-r", str(frame_rate), "-i", "-",
+            "-an", "-c:v", "libx264", "-pix_fmt", "yuv420p", "-crf", "18",
+            "-movflags", "+faststart", str(path),
+        ]
+        self.process = subprocess.Popen(command, stdin=subprocess.PIPE)
+        self.frames = queue.Queue(maxsize=queue_size)
+        self.thread = threading.Thread(target=self._feed, daemon=True)
+        self.thread.start()
+
+    def _feed(self):
+        try:
+            while (item := self.frames.get()) is not None:
+                frame, repeat = item
+                data = frame.tobytes()
+                for _ in range(repeat):
+                    self.process.stdin.write(data)
+        except Exception as error:
+            self.error = error
+
+    def _put(self, item):
+        while True:
+            if not self.thread.is_alive() or self.process.poll() is not None:
+                raise RuntimeError(f"ffmpeg stopped encoding {self.path}") from self.error
+            try:
+                self.frames.put(item, timeout=0.5)
+                return
+            except queue.Full:
+                pass
+
+    def write(self, frame, repeat=1):
+        self._put((frame, repeat))
+
+    def close(self, check=True):
+        r"""Finish the video; with ``check``, raise if encoding failed."""
+        try:
+            self._put(None)
+        except RuntimeError:
+            # a feeder that is still running fails on its next write
+            try:
+                self.frames.put_nowait(None)
+            except queue.Full:
+                pass
+        self.thread.join()
+        try:
+            self.process.stdin.close()
+        except BrokenPipeError:
+            pass
+        returncode = self.process.wait()
+        if check and (self.error is not None or returncode != 0):
+            raise RuntimeError(f"ffmpeg failed to encode {self.path}") from self.error
+
+
+class FrameFanout:
+    r"""Hook for :meth:`SceneFileWriter.write_frame` that passes every frame
+    on to ``write_frame`` and to one :class:`Encoder` per output."""
+    def __init__(self, write_frame, outputs, frame_rate, directory, scene_name):
+        self.write_frame = write_frame
+        self.frame_index = 0
+        self.last_frame = None
+        self.encoders = []
+        for output in outputs:
+            step, remainder = divmod(frame_rate, output.frame_rate)
+            if remainder:
+                raise ValueError(
+                    f"{output.frame_rate} fps does not divide the rendered {frame_rate} fps"
+                )
+            encoder = Encoder(directory / output.file_name(scene_name), *output.size,
+                              output.frame_rate)
+            self.encoders.append((output, step, encoder))
+
+    def __call__(self, frame, *args, **kwargs):
+        self.write_frame(frame, *args, **kwargs)
+        repeat = kwargs.get("repeat", 1)
+        start, self.frame_index = self.frame_index, self.frame_index + repeat
+        self.last_frame = frame
+        scaled = {}
+        for output, step, encoder in self.encoders:
+            # number of the frames start, ..., start + repeat - 1 on the coarser grid
+            count = (start + repeat - 1) // step - (start - 1) // step
+            if count:
+                if output.size not in scaled:
+                    scaled[output.size] = downscale(frame, *output.size)
+                encoder.write(scaled[output.size], count)
+
+    def close(self, check=True):
+        r"""Close all encoders; with ``check``, raise the first failure
+        afterwards."""
+        failure = None
+        for _, _, encoder in self.encoders:
+            try:
+                encoder.close(check)
+            except RuntimeError as error:
+                failure = failure or error
+        if failure is not None:
+            raise failure
+
+
+def render_multiresolution(scene_class, outputs, stills=(), directory=None):
+    r"""Render ``scene_class`` once for all video ``outputs`` and ``stills``
+    (:class:`Output` instances); returns the written paths."""
+    outputs, stills = list(outputs), list(stills)
+    largest = max(outputs + stills, key=lambda output: output.width * output.height)
+    frame_rate = max(output.frame_rate for output in outputs) if outputs else 60
+    for output in outputs + stills:
+        if abs(output.width * largest.height - output.height * largest.width) > largest.height:
+            raise ValueError(f"{output.width}x{output.height} has a different aspect ratio")
+    directory = Path(directory or Path(config.media_dir) / "multires")
+    directory.mkdir(parents=True, exist_ok=True)
+    scene_name = scene_class.__name__
+    native = Output(largest.width, largest.height, frame_rate)
+    derived = [
+        output for output in outputs
+        if (output.size, output.frame_rate) != (native.size, native.frame_rate)
+    ]
+
+    with tempconfig({
+        "pixel_width": largest.width, "pixel_height": largest.height,
+        "frame_rate": frame_rate, "disable_caching": True, "preview": False,
+    }):
+        scene = scene_class()
+        file_writer = scene.renderer.file_writer
+        fanout = FrameFanout(file_writer.write_frame, derived, frame_rate, directory, scene_name)
+        file_writer.write_frame = fanout
+        try:
+            scene.render()
+        except BaseException:
+            # do not mask the scene's exception with one of the encoders
+            fanout.close(check=False)
+            raise
+        fanout.close()
+        movie = getattr(file_writer, "movie_file_path", None)
+
+    paths = [directory / output.file_name(scene_name) for output in derived]
+    if len(derived) < len(outputs) and movie and Path(movie).exists():
+        paths.append(Path(shutil.copyfile(movie, directory / native.file_name(scene_name))))
+    for still in stills:
+        if fanout.last_frame is None:
+            logger.warning(f"{scene_name} wrote no frames, no still image")
+            break
+        from PIL import Image
+
+        path = directory / still.file_name(scene_name)
+        Image.fromarray(downscale(fanout.last_frame, *still.size)).save(path)
+        paths.append(path)
+    return paths
+
+
+def main(argv=None):
+    from manim.utils.module_ops import get_module
+
+    parser = argparse.ArgumentParser(
+        prog="python -m manim_content.multires",
+        description="Render a scene once and encode it at several resolutions.",
+    )
+    parser.add_argument("script", type=Path)
+    parser.add_argument("scene")
+    parser.add_argument("outputs", nargs="*", type=Output.parse,
+                        help="video outputs as WIDTHxHEIGHT@FPS")
+    parser.add_argument("--still", action="append", default=[],
+                        type=lambda spec: Output.parse(spec, still=True),
+                        help="also save the last frame as WIDTHxHEIGHT png")
+    args = parser.parse_args(argv)
+    if not args.outputs and not args.still:
+        parser.error("no outputs requested")
+    scene_class = getattr(get_module(args.script), args.scene)
+    for path in render_multiresolution(scene_class, args.outputs, args.still):
+        logger.info(f"wrote {path}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,446 @@
+r"""Truncated power series backed by NumPy arrays.
+
+A :class:`PowerSeries` stores the coefficients of :math:`x^0, \dots,
+x^{N-1}`, i.e. it represents a series modulo :math:`x^N`. There are three
+coefficient domains:
+
+- floats (the default); products switch to FFT convolution for large orders,
+- exact integers and :class:`~fractions.Fraction` objects (``exact=True``),
+- integers modulo a prime below :math:`2^{31}` (``modulus=p``), which keeps
+  exact arithmetic vectorized and is the fastest way to check identities
+  to orders in the tens of thousands.
+
+Exact and modular products use Kronecker substitution (one big integer
+multiplication). Run ``python -m manim_content.power_series ORDER [MODULUS]``
+to check the identities used in the videos. This module does not import
+manim.
+"""
+import math
+import sys
+import time
+from fractions import Fraction
+from numbers import Number
+
+import numpy as np
+
+FFT_THRESHOLD = 256
+_PACK_CHUNK = 32
+
+
+def _normalize(value):
+    r"""Exact representation of a coefficient: an ``int`` whenever possible."""
+    if isinstance(value, (int, np.integer)):
+        return int(value)
+    value = Fraction(value)
+    return value.numerator if value.denominator == 1 else value
+
+
+def _divide(numerator, denominator):
+    return _normalize(Fraction(numerator) / Fraction(denominator))
+
+
+def _pack(values, bits):
+    if len(values) <= _PACK_CHUNK:
+        result = 0
+        for value in reversed(values):
+            result = (result << bits) + value
+        return result
+    mid = len(values) // 2
+    return _pack(values[:mid], bits) + (_pack(values[mid:], bits) << (bits*mid))
+
+
+def _unpack(packed, count, bits):
+    r"""Inverse of :func:`_pack` for coefficients with absolute value
+    below ``2**(bits - 1)``."""
+    if count <= _PACK_CHUNK:
+        mask, half = (1 << bits) - 1, 1 << (bits - 1)
+        digits = []
+        for _ in range(count):
+            digit = packed & mask
+            if digit >= half:
+                digit -= 1 << bits
+            digits.append(digit)
+            packed = (packed - digit) >> bits
+        return digits
+    mid = count // 2
+    shift = bits*mid
+    low = packed & ((1 << shift) - 1)
+    if low >= 1 << (shift - 1):
+        low -= 1 << shift
+    return _unpack(low, mid, bits) + _unpack((packed - low) >> shift, count - mid, bits)
+
+
+def _integer_convolve(a, b, order):
+    r"""First ``order`` coefficients of the product of two integer lists."""
+    a = a[:next((k + 1 for k in range(len(a) - 1, -1, -1) if a[k]), 0)]
+    b = b[:next((k + 1 for k in range(len(b) - 1, -1, -1) if b[k]), 0)]
+    if not a or not b:
+        return [0]*order
+    largest_a, largest_b = max(map(abs, a)), max(map(abs, b))
+    bound = largest_a * largest_b * min(len(a), len(b))
+    bits = bound.bit_length() + 2
+    count = min(order, len(a) + len(b) - 1)
+    return _unpack(_pack(a, bits) * _pack(b, bits), count, bits) + [0]*(order - count)
+
+
+def _as_integers(coefficients):
+    r"""Scale exact coefficients to integers; returns ``(integers, denominator)``."""
+    denominators = [c.denominator for c in coefficients if isinstance(c, Fraction)]
+    denominator = math.lcm(*denominators) if denominators else 1
+    return [int(c*denominator) for c in coefficients], denominator
+
+
+def _exact_convolve(a, b, order):
+    a_int, a_den = _as_integers(a[:order])
+    b_int, b_den = _as_integers(b[:order])
+    product = _integer_convolve(a_int, b_int, order)
+    denominator = a_den * b_den
+    if denominator != 1:
+        product = [_divide(c, denominator) for c in product]
+    return np.array(product, dtype=object)
+
+
+def _modular_convolve(a, b, order, modulus):
+    product = _integer_convolve(a[:order].tolist(), b[:order].tolist(), order)
+    return np.array([c % modulus for c in product], dtype=np.int64)
+
+
+def _float_convolve(a, b, order):
+    # polynomials stay polynomials: trailing zeros would only add FFT noise
+    a, b = np.trim_zeros(a[:order], "b"), np.trim_zeros(b[:order], "b")
+    if len(a) == 0 or len(b) == 0:
+        return np.zeros(order)
+    if min(len(a), len(b)) <= FFT_THRESHOLD:
+        product = np.convolve(a, b)[:order]
+    else:
+        size = 1 << (len(a) + len(b) - 2).bit_length()
+        product = np.fft.irfft(np.fft.rfft(a, size) * np.fft.rfft(b, size), size)[:order]
+    return np.concatenate([product, np.zeros(order - len(product))])
+
+
+def _float_sparse_inverse(f, order):
+    r"""Inverse of a short float polynomial by its linear recurrence, which
+    is more accurate than FFT based Newton iteration."""
+    f = np.trim_zeros(f, "b")
+    degree = len(f) - 1
+    tail = f[:0:-1] / f[0]
+    inverse = np.zeros(order)
+    inverse[0] = 1 / f[0]
+    for n in range(1, order):
+        k = min(n, degree)
+        inverse[n] = -np.dot(tail[degree - k:], inverse[n - k:n])
+    return inverse
+
+
+class PowerSeries:
+    r"""A power series known up to (excluding) :math:`x^{\text{order}}`.
+
+    Parameters
+    ----------
+    coefficients
+        The coefficients of :math:`x^0, x^1, \dots`; their number is the order.
+    exact
+        Whether to compute with Python integers and fractions instead of floats.
+    modulus
+        A prime below :math:`2^{31}`; coefficients are then residues modulo it.
+
+    Coefficients are extracted with ``series[n]``, which is :math:`[x^n]`
+    of the series.
+    """
+    def __init__(self, coefficients, exact=False, modulus=None):
+        self.exact = exact or modulus is not None
+        self.modulus = modulus
+        if modulus is not None:
+            if not 1 < modulus < 2**31:
+                raise ValueError("modulus has to be a prime below 2**31")
+            self.coefficients = np.array([self._scalar(c) for c in coefficients], dtype=np.int64)
+        elif exact:
+            self.coefficients = np.array([_normalize(c) for c in coefficients], dtype=object)
+        else:
+            self.coefficients = np.asarray(coefficients, dtype=float)
+
+    @classmethod
+    def _wrap(cls, coefficients, like):
+        r"""Wrap an already normalized coefficient array, skipping conversion."""
+        series = cls.__new__(cls)
+        series.exact, series.modulus = like.exact, like.modulus
+        series.coefficients = coefficients
+        return series
+
+    @classmethod
+    def monomial(cls, k, order, coefficient=1, exact=False, modulus=None):
+        coefficients = [0]*order
+        if k < order:
+            coefficients[k] = coefficient
+        return cls(coefficients, exact=exact, modulus=modulus)
+
+    @classmethod
+    def one(cls, order, exact=False, modulus=None):
+        return cls.monomial(0, order, exact=exact, modulus=modulus)
+
+    @classmethod
+    def geometric(cls, order, ratio=1, exact=False, modulus=None):
+        r"""The series :math:`1/(1 - rx) = \sum_{n\geq 0} r^n x^n`."""
+        if modulus is not None:
+            return cls([pow(int(ratio), n, modulus) for n in range(order)], modulus=modulus)
+        if exact:
+            return cls([_normalize(ratio)**n for n in range(order)], exact=True)
+        return cls(float(ratio)**np.arange(order))
+
+    @property
+    def order(self):
+        return len(self.coefficients)
+
+    def __len__(self):
+        return self.order
+
+    def __getitem__(self, n):
+        if isinstance(n, slice):
+            return self.coefficients[n]
+        if not 0 <= n < self.order:
+            raise IndexError(f"[x^{n}] is not known for a series of order {self.order}")
+        return self.coefficients[n]
+
+    def __repr__(self):
+        shown = ", ".join(str(c) for c in self.coefficients[:6])
+        dots = ", ..." if self.order > 6 else ""
+        domain = f"modulus={self.modulus}" if self.modulus else f"exact={self.exact}"
+        return f"PowerSeries([{shown}{dots}], order={self.order}, {domain})"
+
+    def truncate(self, order):
+        return self._wrap(self.coefficients[:order], self)
+
+    def to_float(self):
+        if not self.exact:
+            return self
+        if self.modulus is not None:
+            raise TypeError("series modulo a prime cannot be converted to floats")
+        return PowerSeries(self.coefficients.astype(float))
+
+    def _scalar(self, value):
+        if self.modulus is not None:
+            value = _normalize(value)
+            if isinstance(value, Fraction):
+                return value.numerator * pow(value.denominator, -1, self.modulus) % self.modulus
+            return value % self.modulus
+        return _normalize(value) if self.exact else float(value)
+
+    def _reduce(self, coefficients):
+        if self.modulus is not None:
+            coefficients %= self.modulus
+        return self._wrap(coefficients, self)
+
+    def _coerce(self, other):
+        r"""Bring ``self`` and ``other`` to a common order and domain."""
+        if not isinstance(other, PowerSeries):
+            other = PowerSeries.monomial(0, self.order, other, exact=self.exact, modulus=self.modulus)
+        order = min(self.order, other.order)
+        a, b = self.truncate(order), other.truncate(order)
+        if a.modulus != b.modulus:
+            raise ValueError("series modulo different primes cannot be combined")
+        if a.exact != b.exact:
+            a, b = a.to_float(), b.to_float()
+        return a, b
+
+    def __add__(self, other):
+        a, b = self._coerce(other)
+        return a._reduce(a.coefficients + b.coefficients)
+
+    __radd__ = __add__
+
+    def __neg__(self):
+        return self._reduce(-self.coefficients)
+
+    def __sub__(self, other):
+        return self + (-other)
+
+    def __rsub__(self, other):
+        return (-self) + other
+
+    def __mul__(self, other):
+        if isinstance(other, Number):
+            return self._reduce(self.coefficients * self._scalar(other))
+        a, b = self._coerce(other)
+        if a.modulus is not None:
+            product = _modular_convolve(a.coefficients, b.coefficients, a.order, a.modulus)
+        elif a.exact:
+            product = _exact_convolve(a.coefficients, b.coefficients, a.order)
+        else:
+            product = _float_convolve(a.coefficients, b.coefficients, a.order)
+        return a._wrap(product, a)
+
+    __rmul__ = __mul__
+
+    def __truediv__(self, other):
+        if isinstance(other, Number):
+            if self.modulus is not None:
+                return self * Fraction(1, other)
+            if self.exact:
+                return self._wrap(np.array([_divide(c, other) for c in self.coefficients], dtype=object), self)
+            return self._wrap(self.coefficients / other, self)
+        a, b = self._coerce(other)
+        return a * b.inverse()
+
+    def __rtruediv__(self, other):
+        return self.inverse() * other
+
+    def __pow__(self, exponent):
+        result = PowerSeries.one(self.order, exact=self.exact, modulus=self.modulus)
+        base = self
+        while exponent:
+            if exponent & 1:
+                result = result * base
+            base = base * base
+            exponent >>= 1
+        return result
+
+    def inverse(self):
+        r"""The series :math:`1/f`, computed by Newton iteration
+        :math:`h \mapsto h (2 - f h)` with doubling precision."""
+        constant = self.coefficients[0] if self.order else 0
+        if constant == 0:
+            raise ZeroDivisionError("series with vanishing constant term is not invertible")
+        if not self.exact and len(np.trim_zeros(self.coefficients, "b")) <= FFT_THRESHOLD:
+            return self._wrap(_float_sparse_inverse(self.coefficients, self.order), self)
+        if self.modulus is not None:
+            start = [pow(int(constant), -1, self.modulus)]
+        else:
+            start = [_divide(1, constant) if self.exact else 1.0 / constant]
+        result = PowerSeries(start, exact=self.exact, modulus=self.modulus)
+        precision = 1
+        while precision < self.order:
+            precision = min(2*precision, self.order)
+            padding = np.zeros(precision - result.order, dtype=self.coefficients.dtype)
+            result = self._wrap(np.concatenate([result.coefficients, padding]), self)
+            result = result * (2 - self.truncate(precision) * result)
+        return result
+
+    def derivative(self):
+        r"""The derivative; it is known to one order less."""
+        factors = np.arange(1, self.order, dtype=self.coefficients.dtype)
+        return self._reduce(self.coefficients[1:] * factors)
+
+    def integral(self, constant=0):
+        r"""The antiderivative with the given constant term; known to one order more."""
+        if self.modulus is not None:
+            inverses = [pow(n, -1, self.modulus) for n in range(1, self.order + 1)]
+            coefficients = self.coefficients * np.array(inverses, dtype=np.int64) % self.modulus
+        elif self.exact:
+            coefficients = [_divide(c, n + 1) for n, c in enumerate(self.coefficients)]
+        else:
+            coefficients = self.coefficients / np.arange(1, self.order + 1)
+        coefficients = np.concatenate([[self._scalar(constant)], coefficients])
+        return self._wrap(coefficients.astype(self.coefficients.dtype), self)
+
+    def compose(self, inner):
+        r"""The composition :math:`f(g(x))` for a series ``g`` without constant term.
+
+        Uses the baby-step giant-step scheme of Paterson and Stockmeyer: about
+        :math:`2\sqrt{N}` series multiplications plus one matrix product.
+        """
+        a, g = self._coerce(inner)
+        if g.order and g.coefficients[0] != 0:
+            raise ValueError("the inner series has to have a vanishing constant term")
+        order = a.order
+        if order == 0:
+            return a
+        step = math.isqrt(order - 1) + 1
+        powers = [PowerSeries.one(order, exact=a.exact, modulus=a.modulus)]
+        for _ in range(step):
+            powers.append(powers[-1] * g)
+        giant = powers.pop()
+        blocks = -(-order // step)
+        # int64 matrix products could overflow, residues go through Python integers
+        dtype = float if not a.exact else object
+        padded = np.zeros(blocks*step, dtype=dtype)
+        padded[:order] = a.coefficients
+        baby = padded.reshape(blocks, step) @ np.array([p.coefficients for p in powers], dtype=dtype)
+        if a.modulus is not None:
+            baby = (baby % a.modulus).astype(np.int64)
+        result = a._wrap(baby[-1], a)
+        for row in baby[-2::-1]:
+            result = result * giant + a._wrap(row, a)
+        return result
+
+    def times_one_plus(self, k, c=1):
+        r"""The series :math:`f(x) \cdot (1 + c x^k)` in :math:`O(N)`."""
+        result = self.coefficients.copy()
+        if k < self.order:
+            result[k:] += self._scalar(c) * self.coefficients[:self.order - k]
+        return self._reduce(result)
+
+    def over_one_minus(self, k, c=1):
+        r"""The series :math:`f(x) / (1 - c x^k)` in :math:`O(N)`, for ``k >= 1``."""
+        rows = -(-self.order // k)
+        padded = np.zeros(rows*k, dtype=self.coefficients.dtype)
+        padded[:self.order] = self.coefficients
+        padded = padded.reshape(rows, k)
+        c = self._scalar(c)
+        if c == 1 and self.modulus is None:
+            padded = np.cumsum(padded, axis=0)
+        else:
+            for row in range(1, rows):
+                padded[row] += c * padded[row - 1]
+                if self.modulus is not None:
+                    padded[row] %= self.modulus
+        return self._reduce(padded.reshape(-1)[:self.order])
+
+    def allclose(self, other, rtol=1e-9):
+        r"""Coefficientwise comparison; exact series have to agree exactly."""
+        a, b = self._coerce(other)
+        if a.exact:
+            return bool(np.all(a.coefficients == b.coefficients))
+        # FFT round-off is relative to the largest coefficient, not to each one
+        scale = np.max(np.abs(b.coefficients), initial=0.0)
+        return bool(np.allclose(a.coefficients, b.coefficients, rtol=rtol, atol=rtol*scale))
+
+
+def distinct_parts_product(order, exact=False, modulus=None):
+    r"""The product :math:`\prod_{n\geq 1} (1 + q^n)` counting partitions
+    into distinct parts."""
+    result = PowerSeries.one(order, exact=exact, modulus=modulus)
+    for n in range(1, order):
+        result = result.times_one_plus(n)
+    return result
+
+
+def odd_parts_product(order, exact=False, modulus=None):
+    r"""The product :math:`\prod_{n\geq 1} 1/(1 - q^{2n-1})` counting
+    partitions into odd parts."""
+    result = PowerSeries.one(order, exact=exact, modulus=modulus)
+    for k in range(1, order, 2):
+        result = result.over_one_minus(k)
+    return result
+
+
+def verify_identities(order, exact=True, modulus=None):
+    r"""Check the generating function identities from the videos up to
+    :math:`x^{\text{order} - 1}`; returns a dictionary of results."""
+    domain = {"exact": exact, "modulus": modulus}
+    one = PowerSeries.one(order, **domain)
+    x = PowerSeries.monomial(1, order, **domain)
+    geometric = one / (1 - x)
+    indices = np.arange(order, dtype=object)
+    sequence = PowerSeries(indices**2 + 1, **domain)
+    return {
+        "1/(1-x) = sum x^n": geometric.allclose(PowerSeries([1]*order, **domain)),
+        "x/(1-x)^2 = sum n x^n": (x / (1 - x)**2).allclose(PowerSeries(indices, **domain)),
+        "d/dx 1/(1-x) = 1/(1-x)^2": geometric.derivative().allclose(geometric**2),
+        "f(x)/(1-x) has partial sums": (sequence / (1 - x)).allclose(
+            PowerSeries(np.cumsum(indices**2 + 1), **domain)
+        ),
+        "prod (1+q^n) = prod 1/(1-q^(2n-1))": distinct_parts_product(order, **domain).allclose(
+            odd_parts_product(order, **domain)
+        ),
+    }
+
+
+if __name__ == "__main__":
+    order = int(sys.argv[1]) if len(sys.argv) > 1 else 1000
+    modulus = int(sys.argv[2]) if len(sys.argv) > 2 else None
+    start = time.perf_counter()
+    results = verify_identities(order, modulus=modulus)
+    for name, holds in results.items():
+        print(f"{'ok  ' if holds else 'FAIL'} {name}")
+    print(f"checked up to x^{order - 1} in {time.perf_counter() - start:.2f}s")
+    sys.exit(0 if all(results.values()) else 1)
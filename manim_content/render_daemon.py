@@ -0,0 +1,232 @@
+r"""Keep manim warm and re-render one scene whenever its script changes.
+
+::
+
+    python -m manim_content.render_daemon 2022-04_partitions.py YTEnumeration --port 8765
+
+The script is imported once, like manim does it, so module level code
+(the house style, the TeX template, the asset and mobject caches) runs
+only at startup, and manim's in-process TeX cache stays filled between
+renders. When the script is saved, its top-level statements are compared
+with the previous version: if only class and function definitions
+changed, just these are executed again in the existing module, together
+with all definitions that (transitively) refer to them, such as
+subclasses of a changed scene. If anything else changed, or other module
+level code refers to a changed definition, the whole module is
+re-executed. Afterwards the scene is rendered and the
+result copied to ``<media_dir>/preview/<Scene>.mp4`` (or ``.png``).
+
+With ``--port``, the preview directory is served over HTTP on localhost;
+its index page reloads the video whenever a new render is finished.
+"""
+import argparse
+import ast
+import importlib.util
+import json
+import shutil
+import sys
+import threading
+import time
+import traceback
+from functools import partial
+from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+from manim import config, logger, tempconfig
+
+INDEX_PAGE = """<!doctype html>
+<title>{scene}</title>
+<body style="margin:0;background:#222">
+<video id="preview" src="{scene}.mp4" autoplay loop controls style="width:100%"></video>
+<img id="still" style="width:100%;display:none">
+<script>
+let version = null;
+async function poll() {{
+  try {{
+    const status = await (await fetch("status.json", {{cache: "no-store"}})).json();
+    if (status.version !== version) {{
+      version = status.version;
+      const video = document.getElementById("preview"), still = document.getElementById("still");
+      const isVideo = status.file.endsWith(".mp4");
+      video.style.display = isVideo ? "" : "none";
+      still.style.display = isVideo ? "none" : "";
+      (isVideo ? video : still).src = status.file + "?v=" + version;
+    }}
+  }} catch (error) {{}}
+  setTimeout(poll, 500);
+}}
+poll();
+</script>
+"""
+
+
+class _QuietHandler(SimpleHTTPRequestHandler):
+    def log_message(self, format, *args):
+        pass
+
+
+def _is_definition(node):
+    return isinstance(node, (ast.ClassDef, ast.FunctionDef, ast.AsyncFunctionDef))
+
+
+def _referenced_names(node):
+    return {name.id for name in ast.walk(node) if isinstance(name, ast.Name)}
+
+
+def changed_definitions(old_tree, new_tree):
+    r"""The top-level definitions of ``new_tree`` that differ from those of
+    ``old_tree`` or refer to such a definition, directly or through other
+    definitions; ``None`` if any other top-level statement changed or
+    refers to a changed definition.
+
+    Statements are compared without their positions, so moving code
+    around does not count as a change.
+    """
+    def others(tree):
+        return [node for node in tree.body if not _is_definition(node)]
+
+    if [ast.dump(node) for node in others(old_tree)] != [ast.dump(node) for node in others(new_tree)]:
+        return None
+    old = {node.name: ast.dump(node) for node in old_tree.body if _is_definition(node)}
+    definitions = [node for node in new_tree.body if _is_definition(node)]
+    changed = {node.name for node in definitions if old.get(node.name) != ast.dump(node)}
+    references = {id(node): _referenced_names(node) for node in definitions}
+    while True:
+        dependents = {
+            node.name for node in definitions
+            if node.name not in changed and references[id(node)] & changed
+        }
+        if not dependents:
+            break
+        changed |= dependents
+    if any(_referenced_names(node) & changed for node in others(new_tree)):
+        return None
+    return [node for node in definitions if node.name in changed]
+
+
+class RenderDaemon:
+    r"""Watch ``script`` and render its scene ``scene_name`` after every
+    change, with the ``config`` overrides in ``options``."""
+    def __init__(self, script, scene_name, options=None, interval=0.3):
+        self.script = Path(script).resolve()
+        # the module name manim would use for this script
+        self.module_name = ".".join(Path(script).with_suffix("").parts)
+        self.scene_name = scene_name
+        self.options = options or {}
+        self.interval = interval
+        self.preview_dir = Path(config.media_dir) / "preview"
+        self.preview_dir.mkdir(parents=True, exist_ok=True)
+        self.version = 0
+        self.module = None
+        self.tree = None
+        self.mtime = None
+
+    def load_module(self):
+        r"""Import the script as manim does, under a name derived from its path."""
+        spec = importlib.util.spec_from_file_location(self.module_name, self.script)
+        module = importlib.util.module_from_spec(spec)
+        sys.modules[self.module_name] = module
+        if str(self.script.parent) not in sys.path:
+            sys.path.insert(0, str(self.script.parent))
+        spec.loader.exec_module(module)
+        self.module = module
+
+    def reload(self):
+        r"""Bring the module up to date with the script; returns a short
+        description of what was executed."""
+        source = self.script.read_text()
+        tree = ast.parse(source, filename=str(self.script))
+        changed = None if self.module is None else changed_definitions(self.tree, tree)
+        if changed is None:
+            self.load_module()
+            description = "module"
+        else:
+            code = compile(ast.Module(body=changed, type_ignores=[]), str(self.script), "exec")
+            exec(code, self.module.__dict__)
+            description = ", ".join(node.name for node in changed) or "nothing"
+        self.tree = tree
+        return description
+
+    def render(self):
+        scene_class = getattr(self.module, self.scene_name)
+        with tempconfig({**self.options, "preview": False}):
+            scene = scene_class()
+            scene.render()
+            file_writer = scene.renderer.file_writer
+            result = getattr(file_writer, "movie_file_path", None)
+            if not result or not Path(result).exists():
+                result = getattr(file_writer, "image_file_path", None)
+        if not result or not Path(result).exists():
+            raise FileNotFoundError(f"{self.scene_name} did not produce a file")
+        result = Path(result)
+        preview = self.preview_dir / f"{self.scene_name}{result.suffix}"
+        temporary = preview.with_name(f".{preview.name}.tmp")
+        shutil.copyfile(result, temporary)
+        temporary.replace(preview)
+        self.version += 1
+        (self.preview_dir / "status.json").write_text(
+            json.dumps({"version": self.version, "file": preview.name})
+        )
+        return preview
+
+    def update(self):
+        r"""Reload and render once; errors are logged, not raised."""
+        start = time.perf_counter()
+        try:
+            description = self.reload()
+            preview = self.render()
+        except Exception:
+            logger.error(traceback.format_exc())
+            return
+        logger.info(
+            f"re-executed {description}, rendered {preview} "
+            f"in {time.perf_counter() - start:.1f}s"
+        )
+
+    def serve(self, port):
+        (self.preview_dir / "index.html").write_text(INDEX_PAGE.format(scene=self.scene_name))
+        handler = partial(_QuietHandler, directory=str(self.preview_dir))
+        server = ThreadingHTTPServer(("127.0.0.1", port), handler)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        logger.info(f"serving the preview on http://127.0.0.1:{port}/")
+        return server
+
+    def run(self):
+        while True:
+            mtime = self.script.stat().st_mtime_ns
+            if mtime != self.mtime:
+                self.mtime = mtime
+                self.update()
+            time.sleep(self.interval)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        prog="python -m manim_content.render_daemon",
+        description="Re-render a scene whenever its script is saved.",
+    )
+    parser.add_argument("script")
+    parser.add_argument("scene")
+    parser.add_argument("-q", "--quality", default="low_quality",
+                        choices=["low_quality", "medium_quality", "high_quality",
+                                 "production_quality", "fourk_quality"])
+    parser.add_argument("-s", "--save-last-frame", action="store_true",
+                        help="render only the last frame as an image")
+    parser.add_argument("--port", type=int, default=None, help="serve the preview over HTTP")
+    parser.add_argument("--interval", type=float, default=0.3,
+                        help="seconds between checks of the script")
+    args = parser.parse_args(argv)
+    options = {"quality": args.quality}
+    if args.save_last_frame:
+        options["save_last_frame"] = True
+    daemon = RenderDaemon(args.script, args.scene, options, args.interval)
+    if args.port is not None:
+        daemon.serve(args.port)
+    try:
+        daemon.run()
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,200 @@
+r"""Random partitions of large ``n``, without enumerating them.
+
+Samples are returned in multiplicity form, a dictionary
+``{part: multiplicity}`` in increasing order of the parts, for the
+families ``all``, ``distinct`` and ``odd`` of
+:mod:`manim_content.combinatorics`. Two samplers are available:
+
+- :func:`uniform_partition` is exactly uniform; it uses a table of the
+  (exact) numbers of partitions up to ``n``, which is cheap up to
+  ``n`` of about ``10**5``.
+- :func:`boltzmann_partition` draws the multiplicities as independent
+  geometric variables (Fristedt's Boltzmann model) and conditions on the
+  size by rejection. The multiplicity of the part 1 is not drawn but
+  completed to ``n`` and accepted with the right probability
+  (probabilistic divide-and-conquer), so only about ``n**(1/4)`` attempts
+  are needed. Its samples are exactly uniform, too, and it needs no
+  tables, which makes it the choice for ``n`` in the millions.
+
+Partitions into distinct parts are sampled as partitions into odd parts
+and mapped by the inverse of Glaisher's bijection, which preserves
+uniformity. Both samplers take a ``seed`` (or a generator, a
+:class:`random.Random` resp. a :class:`numpy.random.Generator`) and are
+reproducible. This module does not import manim.
+"""
+import functools
+import math
+import random
+from collections import defaultdict
+
+import numpy as np
+
+from manim_content.combinatorics import odd_to_unique_multiplicities
+
+FAMILIES = ("all", "distinct", "odd")
+
+
+@functools.lru_cache(maxsize=4)
+def partition_numbers(n, family="all"):
+    r"""The numbers of partitions of ``0, ..., n`` in ``family``, as exact
+    integers (by Euler's pentagonal number theorem)."""
+    p = [1] + [0] * n
+    for m in range(1, n + 1):
+        total, k = 0, 1
+        while True:
+            pentagonal = k * (3*k - 1) // 2
+            if pentagonal > m:
+                break
+            term = p[m - pentagonal]
+            if pentagonal + k <= m:
+                term += p[m - pentagonal - k]
+            total += term if k % 2 else -term
+            k += 1
+        p[m] = total
+    if family == "all":
+        return p
+    # prod (1 + x^k) = prod 1/(1 - x^k) * prod (1 - x^(2k))
+    q = []
+    for m in range(n + 1):
+        total, k = p[m], 1
+        while k * (3*k - 1) <= m:
+            term = p[m - k*(3*k - 1)]
+            if k * (3*k + 1) <= m:
+                term += p[m - k*(3*k + 1)]
+            total += -term if k % 2 else term
+            k += 1
+        q.append(total)
+    return q
+
+
+@functools.lru_cache(maxsize=4)
+def divisor_sums(n, odd=False):
+    r"""The sums of the (odd) divisors of ``0, ..., n``."""
+    sums = np.zeros(n + 1, dtype=np.int64)
+    for d in range(1, n + 1, 2 if odd else 1):
+        sums[d::d] += d
+    return sums.tolist()
+
+
+def _divisors(k, odd=False):
+    small = [d for d in range(1, math.isqrt(k) + 1) if k % d == 0]
+    divisors = small + [k // d for d in reversed(small) if d * d != k]
+    return [d for d in divisors if d % 2] if odd else divisors
+
+
+def _check_family(family):
+    if family not in FAMILIES:
+        raise ValueError(f"unknown family {family!r}, expected one of {FAMILIES}")
+
+
+def uniform_partition(n, family="all", seed=None):
+    r"""An exactly uniform random partition of ``n`` in ``family``, in
+    multiplicity form.
+
+    This is the algorithm of Nijenhuis and Wilf: since
+    :math:`m\,p(m) = \sum_k \sigma(k)\,p(m - k)`, the partition is built by
+    choosing ``k`` with probability :math:`\sigma(k)\,p(m-k) / (m\,p(m))`,
+    then a divisor ``d`` of ``k`` with probability proportional to ``d``,
+    and adding ``k/d`` parts ``d``. For odd parts, :math:`\sigma` only
+    counts the odd divisors.
+    """
+    _check_family(family)
+    rng = seed if isinstance(seed, random.Random) else random.Random(seed)
+    odd = family != "all"
+    counts = partition_numbers(n, "all" if family == "all" else "odd")
+    sigma = divisor_sums(n, odd)
+    multiplicities = defaultdict(int)
+    m = n
+    while m > 0:
+        r = rng.randrange(m * counts[m])
+        k = 0
+        while r >= 0:
+            k += 1
+            r -= sigma[k] * counts[m - k]
+        # r + sigma[k] * counts[m - k] is uniform, and so is its quotient
+        r = (r + sigma[k] * counts[m - k]) // counts[m - k]
+        for d in _divisors(k, odd):
+            r -= d
+            if r < 0:
+                break
+        multiplicities[d] += k // d
+        m -= k
+    multiplicities = dict(sorted(multiplicities.items()))
+    if family == "distinct":
+        return odd_to_unique_multiplicities(multiplicities)
+    return multiplicities
+
+
+def boltzmann_parameter(n, family="all"):
+    r"""The Boltzmann parameter :math:`t` (with :math:`x = e^{-t}`) for which
+    the expected size is asymptotically ``n``."""
+    return math.pi / math.sqrt((6 if family == "all" else 12) * n)
+
+
+def boltzmann_partition(n, family="all", seed=None, batch_size=32):
+    r"""A uniform random partition of ``n`` in ``family``, in multiplicity
+    form, by a Boltzmann sampler with rejection.
+
+    The multiplicity of every part ``d > 1`` is geometric with parameter
+    :math:`x^d`. Parts up to a cutoff, above which the expected number of
+    parts is below one, are drawn for ``batch_size`` attempts at once; the
+    rare larger parts are found by thinning. The remainder is filled up
+    with ones, which is accepted with probability :math:`x^{m_1}`.
+    """
+    _check_family(family)
+    rng = np.random.default_rng(seed)
+    if n == 0:
+        return {}
+    odd = family != "all"
+    step = 2 if odd else 1
+    t = boltzmann_parameter(n, family)
+    cutoff = min(n, math.ceil(math.log(n + 1) / t))
+    parts = np.arange(1 + step, cutoff + 1, step)
+    p_parts = -np.expm1(-t * parts)
+    while True:
+        counts = rng.geometric(p_parts, size=(batch_size, len(parts))) - 1
+        sizes = counts @ parts
+        accept = rng.random(batch_size)
+        for row in np.flatnonzero(sizes <= n):
+            tail = _tail(n, cutoff, step, t, rng)
+            ones = n - int(sizes[row]) - sum(d * c for d, c in tail.items())
+            if ones < 0 or accept[row] >= math.exp(-t * ones):
+                continue
+            multiplicities = {1: ones} if ones else {}
+            nonzero = np.flatnonzero(counts[row])
+            multiplicities.update(zip(parts[nonzero].tolist(), counts[row, nonzero].tolist()))
+            multiplicities.update(tail)
+            if family == "distinct":
+                return odd_to_unique_multiplicities(multiplicities)
+            return multiplicities
+
+
+def _tail(n, cutoff, step, t, rng):
+    r"""Multiplicities of the parts in ``(cutoff, n]`` (with the parity of
+    ``step``), each geometric with parameter :math:`e^{-td}`: candidates
+    are proposed with the bound :math:`e^{-t(\text{cutoff}+1)}` and thinned."""
+    tail = {}
+    bound = math.exp(-t * (cutoff + 1))
+    first = cutoff + 1 if step == 1 or cutoff % 2 == 0 else cutoff + 2
+    d = first - step
+    while True:
+        d += step * int(rng.geometric(bound))
+        if d > n:
+            return tail
+        if rng.random() * bound < math.exp(-t * d):
+            tail[d] = int(rng.geometric(-math.expm1(-t * d)))
+
+
+def sample_partitions(n, count, family="all", method="boltzmann", seed=None):
+    r"""Yield ``count`` random partitions of ``n`` (in multiplicity form) from
+    one seeded generator, with ``method`` ``"boltzmann"`` or ``"uniform"``."""
+    if method == "uniform":
+        rng = random.Random(seed)
+        sample = uniform_partition
+    elif method == "boltzmann":
+        rng = np.random.default_rng(seed)
+        sample = boltzmann_partition
+    else:
+        raise ValueError(f"unknown method {method!r}")
+    for _ in range(count):
+        yield sample(n, family, rng)
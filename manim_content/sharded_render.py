@@ -0,0 +1,160 @@
+r"""Render one long scene with several processes, split along its timeline.
+
+::
+
+    python -m manim_content.sharded_render 2022-06_four-gf-problems.py Problem2 \
+        --jobs 4 -q high_quality
+
+A first pass, in which every animation is skipped and thus no frame is
+drawn, records the run time of every ``play`` (and ``wait``) call. The
+calls are then split into contiguous ranges of about equal duration, and
+every worker renders the whole scene with
+``from_animation_number`` / ``upto_animation_number`` set to its range:
+``construct`` runs completely, but all animations outside the range are
+skipped, so the mobjects are in the right state when the range starts.
+All runs use the same random seed, hence calls like ``random.choice``
+make the same choices in every worker. The segments are joined with
+ffmpeg's concat demuxer without re-encoding.
+
+Partial-movie caching is disabled, and every worker gets its own
+directory for partial movie files; the TeX cache is shared.
+"""
+import argparse
+import random
+import subprocess
+from multiprocessing import get_context
+from pathlib import Path
+
+import numpy as np
+from manim import config, logger, tempconfig
+
+SEED = 0
+
+# from_animation_number for skipping all animations of a scene
+SKIP_ALL = 2**31 - 1
+
+
+def _load_scene_class(script, scene_name):
+    from manim.utils.module_ops import get_module
+
+    return getattr(get_module(Path(script)), scene_name)
+
+
+def _make_scene(scene_class, seed):
+    random.seed(seed)
+    np.random.seed(seed)
+    return scene_class(random_seed=seed)
+
+
+def play_durations(scene_class, seed=SEED):
+    r"""The run times of all ``play`` calls of a scene, from a run that
+    skips all animations (``dry_run`` alone would still draw every frame)."""
+    durations = []
+    with tempconfig({
+        "dry_run": True, "disable_caching": True, "preview": False,
+        "from_animation_number": SKIP_ALL,
+    }):
+        scene = _make_scene(scene_class, seed)
+        play = scene.play
+
+        def recording_play(*args, **kwargs):
+            result = play(*args, **kwargs)
+            durations.append(getattr(scene, "duration", 0))
+            return result
+
+        scene.play = recording_play
+        scene.render()
+    return durations
+
+
+def split_timeline(durations, jobs, overhead=0.5):
+    r"""Split the play calls into at most ``jobs`` contiguous ranges
+    ``(first, last)`` of about equal cost; every call costs its duration
+    plus ``overhead`` seconds."""
+    costs = np.asarray(durations, dtype=float) + overhead
+    if not len(costs):
+        return []
+    bounds = np.cumsum(costs)
+    targets = bounds[-1] * np.arange(1, jobs) / jobs
+    cuts = np.unique(np.searchsorted(bounds, targets, side="left") + 1)
+    cuts = cuts[(cuts > 0) & (cuts < len(costs))]
+    edges = [0, *cuts.tolist(), len(costs)]
+    return [(first, last - 1) for first, last in zip(edges, edges[1:])]
+
+
+def render_range(task):
+    r"""Render the plays ``first`` to ``last`` of a scene into their own file
+    (run in a worker process); returns the path of the segment."""
+    script, scene_name, first, last, options, seed = task
+    scene_class = _load_scene_class(script, scene_name)
+    part = f"{scene_name}_part{first:05d}"
+    with tempconfig({
+        **options,
+        "from_animation_number": first,
+        "upto_animation_number": last,
+        "disable_caching": True,
+        "preview": False,
+        "output_file": part,
+    }):
+        # media_dir may come from the options
+        config.partial_movie_dir = str(Path(config.media_dir) / "sharded" / scene_name / part)
+        scene = _make_scene(scene_class, seed)
+        scene.render()
+        return str(scene.renderer.file_writer.movie_file_path)
+
+
+def concatenate(segments, output):
+    r"""Join the video files ``segments`` into ``output`` without re-encoding."""
+    output = Path(output)
+    listing = output.with_suffix(".segments.txt")
+    listing.write_text("".join(
+        "file '{}'\n".format(Path(segment).resolve().as_posix().replace("'", r"'\''"))
+        for segment in segments
+    ))
+    subprocess.run(
+        ["ffmpeg", "-y", "-loglevel", "error", "-f", "concat", "-safe", "0",
+         "-i", str(listing), "-c", "copy", "-movflags", "+faststart", str(output)],
+        check=True,
+    )
+    listing.unlink()
+    return output
+
+
+def render_sharded(script, scene_name, jobs, options=None, seed=SEED, output=None):
+    r"""Render ``scene_name`` from ``script`` with ``jobs`` processes and
+    return the path of the joined video."""
+    options = {"input_file": str(script), **(options or {})}
+    with tempconfig(options):
+        durations = play_durations(_load_scene_class(script, scene_name), seed)
+        ranges = split_timeline(durations, jobs)
+        logger.info(f"{scene_name}: {len(durations)} plays in {len(ranges)} ranges {ranges}")
+        tasks = [(script, scene_name, first, last, options, seed) for first, last in ranges]
+        # fresh interpreters: the workers must not inherit the first pass's state
+        with get_context("spawn").Pool(min(jobs, len(tasks))) as pool:
+            segments = pool.map(render_range, tasks, chunksize=1)
+        if output is None:
+            output = Path(segments[-1]).with_name(f"{scene_name}.mp4")
+        return concatenate(segments, output)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        prog="python -m manim_content.sharded_render",
+        description="Render one scene with several processes, split by play calls.",
+    )
+    parser.add_argument("script")
+    parser.add_argument("scene")
+    parser.add_argument("--jobs", type=int, default=4)
+    parser.add_argument("-q", "--quality", default="high_quality",
+                        choices=["low_quality", "medium_quality", "high_quality",
+                                 "production_quality", "fourk_quality"])
+    parser.add_argument("--seed", type=int, default=SEED)
+    parser.add_argument("-o", "--output", default=None)
+    args = parser.parse_args(argv)
+    path = render_sharded(args.script, args.scene, args.jobs, {"quality": args.quality},
+                          args.seed, args.output)
+    logger.info(f"wrote {path}")
+
+
+if __name__ == "__main__":
+    main()
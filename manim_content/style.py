@@ -0,0 +1,37 @@
+r"""Colors and the TeX template shared by the videos.
+
+manim is only imported once :func:`apply_house_style` or
+:func:`tex_template` is called, so importing the colors is cheap.
+"""
+from functools import cache
+
+BH_DARKGREEN = '#455D3E'
+BH_ORANGE = '#E68330'
+
+
+@cache
+def tex_template(documentclass=None):
+    r"""The TeX template with the Charter math font, built once per ``documentclass``."""
+    from manim import TexTemplate
+
+    if documentclass is None:
+        template = TexTemplate()
+    else:
+        template = TexTemplate(documentclass=documentclass)
+    template.add_to_preamble(r"\usepackage[charter]{mathdesign}")
+    return template
+
+
+def apply_house_style(documentclass=None):
+    r"""Use :func:`tex_template` for all :class:`~.MathTex` and the dark
+    green background; also enables :mod:`~.draft` mode and
+    :mod:`~.copy_on_write` copies as requested by the environment."""
+    from manim import MathTex, config
+
+    from manim_content.copy_on_write import enable_copy_on_write_from_environment
+    from manim_content.draft import enable_draft_mode_from_environment
+
+    MathTex.set_default(tex_template=tex_template(documentclass))
+    config.background_color = BH_DARKGREEN
+    enable_draft_mode_from_environment()
+    enable_copy_on_write_from_environment()
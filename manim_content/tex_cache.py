@@ -0,0 +1,85 @@
+r"""In-memory cache of typeset :class:`~.MathTex` and :class:`~.Tex`.
+
+::
+
+    label = math_tex(r"\frac{5}{6}", font_size=30)
+
+builds the mobject only the first time such a label is requested;
+afterwards it is a copy of the cached prototype, which skips writing and
+hashing the TeX file, reading the SVG, splitting it into parts and
+scaling it to ``font_size``. The key contains the class, the TeX strings,
+all keyword arguments (including those set with
+:meth:`~.Mobject.set_default`) and the body of the TeX template. At most
+:data:`MAX_ENTRIES` prototypes are kept, the least recently used ones are
+dropped first.
+"""
+from collections import OrderedDict
+from functools import partialmethod
+
+from manim import MathTex, Tex, config
+from manim.mobject.text import tex_mobject
+
+MAX_ENTRIES = 256
+
+_prototypes = OrderedDict()
+
+
+def _default_kwargs(cls):
+    r"""The keyword arguments set with :meth:`~.Mobject.set_default` for
+    ``cls`` and its base classes."""
+    layers = []
+    for klass in cls.__mro__:
+        init = vars(klass).get("__init__")
+        while isinstance(init, partialmethod):
+            layers.append(init.keywords)
+            init = getattr(init.func, "_partialmethod", None)
+    defaults = {}
+    for keywords in reversed(layers):
+        defaults.update(keywords)
+    return defaults
+
+
+def template_body(template):
+    return getattr(template, "body", repr(template))
+
+
+def default_tex_template(cls=MathTex):
+    r"""The TeX template that ``cls`` uses when none is passed."""
+    return _default_kwargs(cls).get("tex_template") or config.tex_template
+
+
+def cache_key(cls, tex_strings, kwargs):
+    options = {**_default_kwargs(cls), **kwargs}
+    template = options.pop("tex_template", None) or config.tex_template
+    return (
+        cls.__module__, cls.__qualname__, tex_strings,
+        repr(sorted(options.items())), template_body(template),
+        # placeholders in draft mode must not be mixed up with real TeX
+        tex_mobject.tex_to_svg_file.__name__,
+    )
+
+
+def cached_tex(cls, *tex_strings, **kwargs):
+    r"""``cls(*tex_strings, **kwargs)``, copied from a cached prototype."""
+    key = cache_key(cls, tex_strings, kwargs)
+    prototype = _prototypes.get(key)
+    if prototype is None:
+        prototype = cls(*tex_strings, **kwargs)
+        _prototypes[key] = prototype
+        while len(_prototypes) > MAX_ENTRIES:
+            _prototypes.popitem(last=False)
+    else:
+        _prototypes.move_to_end(key)
+    return prototype.copy()
+
+
+def math_tex(*tex_strings, **kwargs):
+    return cached_tex(MathTex, *tex_strings, **kwargs)
+
+
+def tex(*tex_strings, **kwargs):
+    return cached_tex(Tex, *tex_strings, **kwargs)
+
+
+def clear_tex_cache():
+    _prototypes.clear()